@@ -166,7 +166,7 @@ def _present_long_block(start_addr: int, perms: dict, e_norm: str, address_was_h
         if info is None:
             continue
         u32 = int(info.get('uint32', 0))
-        i32 = u32 if u32 < 0x80000000 else u32 - 0x100000000
+        i32 = u32 - ((u32 & 0x80000000) << 1)
         table.add_row(idx_disp, k, info['hex'], str(u32), str(i32), str(info['float']))
     console.print(table)
 
@@ -204,7 +204,7 @@ def _present_long_table(start_addr: int, perms_list: List[dict], e_norm: str, ad
         if info is None:
             continue
         u32 = int(info.get('uint32', 0))
-        i32 = u32 if u32 < 0x80000000 else u32 - 0x100000000
+        i32 = u32 - ((u32 & 0x80000000) << 1)
         table.add_row(idx_disp, display_key, info['hex'], str(u32), str(i32), str(info['float']))
 
     console.print(table)
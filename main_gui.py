@@ -1,10 +1,20 @@
 import sys
 import os
+import json
+import re
 import asyncio
+import itertools
+import math
+import socket
+import struct
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Optional, Union
-from collections import deque
-from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from PySide6.QtWidgets import (
     QApplication,
@@ -19,14 +29,14 @@ from PySide6.QtWidgets import (
     QTabWidget,
     QSizePolicy,
     QTableView,
-    QTableWidget,
-    QTableWidgetItem,
     QHeaderView,
     QMessageBox,
     QSpinBox,
+    QFileDialog,
+    QCheckBox,
 )
 from PySide6.QtGui import QIcon, QBrush, QColor
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtCore import Qt, QAbstractTableModel, QEvent, QModelIndex, QTimer, Signal
 from PySide6.QtWidgets import QTextEdit
 import qasync
 from umdt.core.data_types import (
@@ -35,7 +45,7 @@ from umdt.core.data_types import (
     is_bit_type,
     is_register_type,
 )
-from umdt.core.prober import Prober, TargetSpec
+from umdt.core.prober import Prober, ProbeResult, TargetSpec
 from serial.tools import list_ports
 from urllib.parse import urlparse, parse_qs
 from umdt.utils.ieee754 import from_bytes_to_float16
@@ -54,7 +64,14 @@ from umdt.utils.modbus_compat import (
     write_coils,
     invoke_method,
 )
-from umdt.utils.decoding import decode_registers, decode_to_table_dict
+from umdt.utils.decoding import decode_registers, decode_to_table_dict, unpack_register_pairs
+from umdt.utils.encoding import encode_float16
+from umdt.utils.timefmt import format_clock_ms
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from umdt.utils.parsing import expand_csv_or_range
 import logging
 import inspect
@@ -68,8 +85,97 @@ if not logging.getLogger().hasHandlers():
     logging.getLogger('pymodbus').setLevel(logging.INFO)
 logger = logging.getLogger("umdt.gui")
 
-
-@dataclass
+# One 16-bit register as 2 big-endian bytes
+_U16_BE = struct.Struct(">H")
+# Two 16-bit registers packed big-endian into one 4-byte buffer
+_U16U16_BE = struct.Struct(">HH")
+_U16U16_LE = struct.Struct("<HH")
+
+# 4-byte reorderings between wire order (AB CD) and big-endian ABCD. Each
+# permutation is its own inverse, so the same table serves reads and writes.
+_PERMUTE_32 = {
+    "big": lambda b: b,
+    "little": lambda b: b[::-1],
+    "mid-big": lambda b: _U16U16_BE.pack(*_U16U16_BE.unpack(b)[::-1]),
+    "mid-little": lambda b: _U16U16_LE.pack(*_U16U16_BE.unpack(b)),
+}
+
+
+
+@lru_cache(maxsize=None)
+def _half_table() -> tuple:
+    """Float value of every 16-bit pattern read as float16, built on first use."""
+    return struct.unpack(">65536e", struct.pack(">65536H", *range(0x10000)))
+
+
+@lru_cache(maxsize=65536)
+def _format_half(reg_val: int) -> str:
+    """Format a big-endian float16 register for the monitor table."""
+    f16 = _half_table()[reg_val & 0xFFFF]
+    # Inf/NaN patterns have no numeric display
+    return f"{f16:.6g}" if math.isfinite(f16) else "—"
+
+
+def _format_single(raw_be: bytes) -> str:
+    # Total on 4 bytes: NaN/Inf format as "nan"/"inf"
+    return f"{struct.unpack('!f', raw_be)[0]:.6g}"
+
+
+# Monitor cell formatters per decoding name. 16-bit entries take the
+# (endian-corrected) register value, 32-bit entries the big-endian bytes;
+# in long mode "Float16" shows the pair as float32.
+_MONITOR_FMT16 = {
+    "Hex": lambda v: f"0x{v:04X}",
+    "Unsigned": str,
+    "Signed": lambda v: str(v - ((v & 0x8000) << 1)),
+    "Float16": _format_half,
+}
+_MONITOR_FMT32 = {
+    "Hex": lambda b: "0x" + b.hex().upper(),
+    "Unsigned": lambda b: str(int.from_bytes(b, byteorder="big", signed=False)),
+    "Signed": lambda b: str(int.from_bytes(b, byteorder="big", signed=True)),
+    "Float16": _format_single,
+}
+
+# Leading "0x" (optionally signed) marks hex input; avoids copying the text
+_HEX_PREFIX_RE = re.compile(r"\s*[+-]?0[xX]")
+
+# Byte orders shown by the details panel when the shared decoder fails
+_FALLBACK_DETAIL_ORDERS = (('Big', 'big'), ('Little', 'little'))
+
+# Accepted endian spellings (short and long) -> canonical name
+_ENDIAN_MAP = {
+    "b": "big",
+    "big": "big",
+    "l": "little",
+    "little": "little",
+    "mb": "mid-big",
+    "mid-big": "mid-big",
+    "ml": "mid-little",
+    "mid-little": "mid-little",
+}
+_ENDIAN_MAP_ALL = {**_ENDIAN_MAP, "all": "all"}
+
+# Modbus per-request read limits (registers / coils and discrete inputs)
+_MAX_READ_REGISTERS = 125
+_MAX_READ_BITS = 2000
+
+# Minimum seconds between probe progress updates in the status label
+_PROBE_STATUS_INTERVAL = 0.1
+
+# The scan loop hands control back to Qt at most once per frame (~60 Hz)
+_SCAN_YIELD_INTERVAL = 0.016
+
+# Data types in the order the type combos list them (index -> DataType)
+_DATATYPE_ORDER = (DataType.HOLDING, DataType.INPUT, DataType.COIL, DataType.DISCRETE)
+
+
+def _datatype_at(index: int) -> DataType:
+    """DataType for a type-combo index, falling back to holding registers."""
+    return _DATATYPE_ORDER[index] if 0 <= index < len(_DATATYPE_ORDER) else DataType.HOLDING
+
+
+@dataclass(slots=True)
 class ReadRow:
     index: str
     hex_value: str
@@ -79,11 +185,12 @@ class ReadRow:
     bool_value: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitorSample:
     """A single monitor poll sample (one interval)."""
     timestamp: str
-    raw_registers: List[Union[int, bool]]
+    # Packed 16-bit words (array('H')); bits are stored as 0/1
+    raw_registers: Sequence[int]
     address_start: int
     unit_id: int
     data_type: DataType
@@ -95,10 +202,18 @@ class MonitorModel(QAbstractTableModel):
     
     def __init__(self, max_samples: int = 1000):
         super().__init__()
-        self._samples: deque = deque(maxlen=max_samples)
+        # Fixed-size ring: O(1) row lookup for data(), unlike deque indexing
+        self._ring: List[Optional[MonitorSample]] = [None] * max_samples
+        self._head = 0  # slot the next sample is written to
+        self._count = 0
         self._max_samples = max_samples
         self._value_count = 1
         self._decoding = "Signed"  # Hex, Unsigned, Signed, Float16
+        self._fmt16 = _MONITOR_FMT16[self._decoding]
+        self._fmt32 = _MONITOR_FMT32[self._decoding]
+        # Display strings keyed by raw register value(s); valid for the
+        # current decoding/endian/long-mode and cleared when they change
+        self._fmt_cache: dict = {}
         self._long_mode = False
         self._endian = "big"
         self._start_addr = 0
@@ -113,17 +228,30 @@ class MonitorModel(QAbstractTableModel):
         self._endian = endian
         self._data_type = data_type
         self._start_addr = max(0, int(start_addr))
+        self._fmt_cache.clear()
         self.update_headers()
 
-    def set_decoding(self, decoding: str):
-        """Change decoding scheme and refresh all displayed data."""
+    def set_decoding(self, decoding: str, visible_top: int = 0, visible_bottom: Optional[int] = None):
+        """Change decoding scheme and refresh the displayed data.
+
+        Views fetch text on paint, so only the visible rows (`visible_top`
+        to `visible_bottom`, default all) need a change notification.
+        """
         self._decoding = decoding
-        # Refresh entire table view
-        if len(self._samples) > 0:
-            self.dataChanged.emit(
-                self.index(0, 1),
-                self.index(len(self._samples) - 1, self.columnCount() - 1)
-            )
+        # Resolve the cell formatters once instead of per repaint
+        self._fmt16 = _MONITOR_FMT16.get(decoding, str)
+        self._fmt32 = _MONITOR_FMT32.get(decoding, _MONITOR_FMT32["Unsigned"])
+        self._fmt_cache.clear()
+        last = self._count - 1
+        if last < 0:
+            return
+        top = min(max(0, visible_top), last)
+        bottom = last if visible_bottom is None or visible_bottom < 0 else min(visible_bottom, last)
+        self.dataChanged.emit(
+            self.index(top, 1),
+            self.index(max(top, bottom), self.columnCount() - 1),
+            [Qt.DisplayRole],
+        )
 
     def update_headers(self):
         """Regenerate column headers based on register count."""
@@ -131,7 +259,7 @@ class MonitorModel(QAbstractTableModel):
         self.endResetModel()
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
-        return len(self._samples)
+        return self._count
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
         # Timestamp + one column per displayed value (register or double-register)
@@ -141,7 +269,7 @@ class MonitorModel(QAbstractTableModel):
         if not index.isValid():
             return None
 
-        sample = self._samples[index.row()]
+        sample = self.sample_at(index.row())
         col = index.column()
 
         if role == Qt.DisplayRole:
@@ -171,55 +299,25 @@ class MonitorModel(QAbstractTableModel):
                     return ""
                 r1 = int(sample.raw_registers[base]) & 0xFFFF
                 r2 = int(sample.raw_registers[base + 1]) & 0xFFFF
-                b1 = r1.to_bytes(2, byteorder="big")
-                b2 = r2.to_bytes(2, byteorder="big")
-                bv = b1 + b2
-                if self._endian == "big":
-                    raw_be = bv
-                elif self._endian == "little":
-                    raw_be = bv[::-1]
-                elif self._endian == "mid-big":
-                    raw_be = bytes([bv[2], bv[3], bv[0], bv[1]])
-                else:
-                    raw_be = bytes([bv[1], bv[0], bv[3], bv[2]])
-                if self._decoding == "Hex":
-                    return "0x" + raw_be.hex().upper()
-                elif self._decoding == "Unsigned":
-                    return str(int.from_bytes(raw_be, byteorder="big", signed=False))
-                elif self._decoding == "Signed":
-                    return str(int.from_bytes(raw_be, byteorder="big", signed=True))
-                elif self._decoding == "Float16":
-                    # In long mode, treat as float32 for convenience
-                    import struct
-                    try:
-                        f32 = struct.unpack("!f", raw_be)[0]
-                        return f"{f32:.6g}"
-                    except Exception:
-                        return "—"
-                return str(int.from_bytes(raw_be, byteorder="big", signed=False))
+                key = (r1 << 16) | r2
+                text = self._fmt_cache.get(key)
+                if text is None:
+                    bv = _U16U16_BE.pack(r1, r2)
+                    raw_be = _PERMUTE_32.get(self._endian, _PERMUTE_32["mid-little"])(bv)
+                    text = self._cache_text(key, self._fmt32(raw_be))
+                return text
 
             # Short (16-bit) mode
             if reg_idx >= len(sample.raw_registers):
                 return ""
-            reg_val = int(sample.raw_registers[reg_idx]) & 0xFFFF
-
-            if self._decoding == "Hex":
-                return f"0x{reg_val:04X}"
-            elif self._decoding == "Unsigned":
-                return str(reg_val)
-            elif self._decoding == "Signed":
-                signed = reg_val if reg_val < 0x8000 else reg_val - 0x10000
-                return str(signed)
-            elif self._decoding == "Float16":
-                try:
-                    b = reg_val.to_bytes(2, byteorder="big", signed=False)
-                    bb = b[::-1] if self._endian == "little" else b
-                    f16 = from_bytes_to_float16(bb)
-                    return f"{f16:.6g}" if f16 is not None else "—"
-                except Exception:
-                    return "—"
-
-            return str(reg_val)
+            key = int(sample.raw_registers[reg_idx]) & 0xFFFF
+            text = self._fmt_cache.get(key)
+            if text is None:
+                reg_val = key
+                if self._endian == "little":
+                    reg_val = ((reg_val & 0xFF) << 8) | (reg_val >> 8)
+                text = self._cache_text(key, self._fmt16(reg_val))
+            return text
 
         if role == Qt.BackgroundRole:
             if sample.error is not None:
@@ -227,6 +325,13 @@ class MonitorModel(QAbstractTableModel):
 
         return None
 
+    def _cache_text(self, key: int, text: str) -> str:
+        # Bound memory for noisy 32-bit data; 16-bit keys never exceed this
+        if len(self._fmt_cache) >= 0x10000:
+            self._fmt_cache.clear()
+        self._fmt_cache[key] = text
+        return text
+
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
             if section == 0:
@@ -237,17 +342,40 @@ class MonitorModel(QAbstractTableModel):
                 return str(addr)
         return super().headerData(section, orientation, role)
 
+    def sample_at(self, row: int) -> MonitorSample:
+        """Return the sample shown at `row` (0 = oldest)."""
+        return self._ring[(self._head - self._count + row) % self._max_samples]
+
     def add_sample(self, sample: MonitorSample):
-        """Add a new sample to the model (thread-safe via Qt signals)."""
-        row = len(self._samples)
-        self.beginInsertRows(QModelIndex(), row, row)
-        self._samples.append(sample)
+        """Add a new sample to the model, evicting the oldest when full."""
+        self.add_samples([sample])
+
+    def add_samples(self, samples: Sequence[MonitorSample]):
+        """Append samples with one insert notification, evicting the oldest when full."""
+        if not samples:
+            return
+        samples = samples[-self._max_samples:]
+        n = len(samples)
+        evict = self._count + n - self._max_samples
+        if evict > 0:
+            # Tell the view the oldest rows go away before their slots are reused
+            self.beginRemoveRows(QModelIndex(), 0, evict - 1)
+            self._count -= evict
+            self.endRemoveRows()
+        row = self._count
+        self.beginInsertRows(QModelIndex(), row, row + n - 1)
+        for sample in samples:
+            self._ring[self._head] = sample
+            self._head = (self._head + 1) % self._max_samples
+        self._count += n
         self.endInsertRows()
 
     def clear_samples(self):
         """Clear all samples."""
         self.beginResetModel()
-        self._samples.clear()
+        self._ring = [None] * self._max_samples
+        self._head = 0
+        self._count = 0
         self.endResetModel()
 
 
@@ -285,11 +413,243 @@ class ReadResultsModel(QAbstractTableModel):
         return super().headerData(section, orientation, role)
 
     def update_rows(self, rows: List[ReadRow]):
+        # Same-shaped re-reads only change cell contents; keep the view's
+        # selection and scroll position instead of resetting the model
+        if rows and len(rows) == len(self._rows):
+            self._rows = rows
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(rows) - 1, len(self.headers) - 1),
+                [Qt.DisplayRole],
+            )
+            return
         self.beginResetModel()
         self._rows = rows
         self.endResetModel()
 
 
+class ScanResultsModel(QAbstractTableModel):
+    """Readable addresses found by the scan tab."""
+
+    headers = ["Address (Dec)", "Address (Hex)", "Status"]
+
+    def __init__(self):
+        super().__init__()
+        self._addresses: List[int] = []
+        self._found_brush = QBrush(QColor(200, 255, 200))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return len(self._addresses)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return len(self.headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            addr = self._addresses[index.row()]
+            col = index.column()
+            if col == 0:
+                return str(addr)
+            if col == 1:
+                return hex(addr)
+            return "Readable"
+        if role == Qt.BackgroundRole:
+            return self._found_brush
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def add_addresses(self, addresses: Sequence[int]):
+        if not addresses:
+            return
+        row = len(self._addresses)
+        self.beginInsertRows(QModelIndex(), row, row + len(addresses) - 1)
+        self._addresses.extend(addresses)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._addresses = []
+        self.endResetModel()
+
+
+class ProbeResultsModel(QAbstractTableModel):
+    """Responding endpoints found by the probe tab."""
+
+    headers = ["URI", "Params", "Status", "Summary", "RTT (ms)"]
+
+    def __init__(self):
+        super().__init__()
+        self._results: List[ProbeResult] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return len(self._results)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return len(self.headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        pr = self._results[index.row()]
+        col = index.column()
+        if col == 0:
+            return pr.uri
+        if col == 1:
+            return str(pr.params)
+        if col == 2:
+            return "ALIVE"
+        if col == 3:
+            return str(pr.response_summary)
+        if col == 4:
+            return f"{pr.elapsed_ms:.1f}"
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def add_results(self, results: Sequence[ProbeResult]):
+        if not results:
+            return
+        row = len(self._results)
+        self.beginInsertRows(QModelIndex(), row, row + len(results) - 1)
+        self._results.extend(results)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._results = []
+        self.endResetModel()
+
+
+class DecodingTableModel(QAbstractTableModel):
+    """Per-endian decoding rows shown by the read and monitor details panes."""
+
+    headers = ["Format", "Hex", "UInt16", "Int16", "Float16", "Hex32", "UInt32", "Int32", "Float32"]
+
+    def __init__(self):
+        super().__init__()
+        self._rows: List[dict] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return len(self.headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self._rows[index.row()].get(self.headers[index.column()], '')
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, rows: List[dict]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def clear(self):
+        self.set_rows([])
+
+
+def _show_width_columns(view: QTableView, is_32: bool) -> None:
+    """Show the 32-bit columns (5-8) or the 16-bit ones (1-4) of a details view."""
+    for col in range(1, 9):
+        view.setColumnHidden(col, (col < 5) == is_32)
+
+
+def _probe_number(text: str) -> Union[int, str]:
+    """Parse a probe port/baud entry, keeping the text if it isn't a number."""
+    try:
+        return int(text, 0)
+    except Exception:
+        return text
+
+
+def _probe_unit(text: str) -> int:
+    """Parse a probe unit id, defaulting to 1 when it isn't a number."""
+    try:
+        return int(text, 0)
+    except Exception:
+        return int(text) if text.isdigit() else 1
+
+
+def _build_probe_combinations(
+    hosts: Sequence[str],
+    ports: Sequence[Union[int, str]],
+    serials: Sequence[str],
+    bauds: Sequence[Union[int, str]],
+    units: Sequence[int],
+) -> List[dict]:
+    """Cartesian product of parsed probe inputs as Prober combination dicts."""
+    combos = [
+        {"host": hh, "port": pp, "unit": uu}
+        for hh, pp, uu in itertools.product(hosts, ports, units)
+    ]
+    combos += [
+        {"serial": dev, "baud": bd, "unit": uu}
+        for dev, bd, uu in itertools.product(serials, bauds, units)
+    ]
+    return combos
+
+
+@lru_cache(maxsize=32)
+def _expand_probe_field(text: str, convert: Optional[Callable] = None) -> tuple:
+    """Expand a probe CSV/range field once per distinct text.
+
+    Re-running a probe with unchanged inputs reuses the parsed tuple instead
+    of expanding ranges and converting every entry again.
+    """
+    items = expand_csv_or_range(text)
+    return tuple(map(convert, items)) if convert else tuple(items)
+
+
+def _use_fixed_row_height(view: QTableView) -> None:
+    """Give every row one text-line height so Qt never measures rows."""
+    vh = view.verticalHeader()
+    vh.setSectionResizeMode(QHeaderView.Fixed)
+    vh.setDefaultSectionSize(vh.fontMetrics().height() + 4)
+
+
+@contextmanager
+def _updates_suspended(view: QWidget):
+    """Hold off repaints of `view` while a batch of rows is inserted."""
+    view.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        view.setUpdatesEnabled(True)
+
+
+def _swap16(word: int) -> int:
+    return ((word & 0xFF) << 8) | (word >> 8)
+
+
+# Registers for a big-endian 32-bit value split into hi/lo words; the same
+# orderings as _PERMUTE_32, done on ints to avoid intermediate byte buffers.
+_WORD_ORDERS = {
+    "big": lambda hi, lo: [hi, lo],
+    "little": lambda hi, lo: [_swap16(lo), _swap16(hi)],
+    "mid-big": lambda hi, lo: [lo, hi],
+    "mid-little": lambda hi, lo: [_swap16(hi), _swap16(lo)],
+}
+
+
+def _order_words(hi: int, lo: int, endian: str) -> List[int]:
+    return _WORD_ORDERS.get(endian, _WORD_ORDERS["mid-little"])(hi, lo)
+
+
 def encode_value_to_registers(
     value_text: str,
     long_mode: bool,
@@ -301,10 +661,7 @@ def encode_value_to_registers(
 
     This consolidates the write encoding logic from the CLI for reuse.
     """
-    import math
-    import struct
-
-    is_hex = value_text.strip().lower().startswith("0x")
+    is_hex = _HEX_PREFIX_RE.match(value_text) is not None
 
     if float_mode:
         if is_hex:
@@ -340,55 +697,11 @@ def encode_value_to_registers(
     # Build register payload
     if float_mode:
         if long_mode:
-            raw_be = struct.pack("!f", float_val)
-            if endian == "big":
-                bv = raw_be
-            elif endian == "little":
-                bv = raw_be[::-1]
-            elif endian == "mid-big":
-                bv = bytes([raw_be[2], raw_be[3], raw_be[0], raw_be[1]])
-            else:  # mid-little
-                bv = bytes([raw_be[1], raw_be[0], raw_be[3], raw_be[2]])
-            regs = [int.from_bytes(bv[0:2], byteorder="big"), int.from_bytes(bv[2:4], byteorder="big")]
+            hi, lo = _U16U16_BE.unpack(struct.pack("!f", float_val))
+            regs = _order_words(hi, lo, endian)
         else:
-            # 16-bit float encoding (same as CLI)
-            f = float_val
-            if math.isnan(f):
-                half = 0x7E00
-            elif math.isinf(f):
-                half = 0x7C00 if f > 0 else 0xFC00
-            else:
-                sign = 0
-                if f < 0:
-                    sign = 0x8000
-                    f = -f
-                if f == 0.0:
-                    half = sign
-                else:
-                    exp = int(math.floor(math.log(f, 2)))
-                    frac = f / (2 ** exp) - 1.0
-                    exp16 = exp + 15
-                    if exp16 <= 0:
-                        mant16 = int(round(f / (2 ** -24)))
-                        half = sign | mant16
-                    elif exp16 >= 0x1F:
-                        half = sign | 0x7C00
-                    else:
-                        mant16 = int(round(frac * (1 << 10)))
-                        if mant16 == (1 << 10):
-                            exp16 += 1
-                            mant16 = 0
-                            if exp16 >= 0x1F:
-                                half = sign | 0x7C00
-                            else:
-                                half = sign | (exp16 << 10) | (mant16 & 0x3FF)
-                        else:
-                            half = sign | (exp16 << 10) | (mant16 & 0x3FF)
-
-            b = half.to_bytes(2, byteorder="big")
-            if endian == "little":
-                b = b[::-1]
-            regs = [int.from_bytes(b, byteorder="big")]
+            # 16-bit float encoding (shared with CLI)
+            regs = encode_float16(float_val, endian)
     else:
         width_bits = 32 if long_mode else 16
         if signed:
@@ -396,26 +709,247 @@ def encode_value_to_registers(
             int_u = int_val & (max_val - 1)
         else:
             int_u = int_val
-        byte_len = width_bits // 8
-        bv = int_u.to_bytes(byte_len, byteorder="big", signed=False)
         if long_mode:
-            if endian == "big":
-                pass
-            elif endian == "little":
-                bv = bv[::-1]
-            elif endian == "mid-big":
-                bv = bytes([bv[2], bv[3], bv[0], bv[1]])
-            else:
-                bv = bytes([bv[1], bv[0], bv[3], bv[2]])
-            regs = [int.from_bytes(bv[0:2], byteorder="big"), int.from_bytes(bv[2:4], byteorder="big")]
+            regs = _order_words(int_u >> 16, int_u & 0xFFFF, endian)
+        elif endian == "little":
+            regs = [_swap16(int_u)]
         else:
-            if endian == "little":
-                bv = bv[::-1]
-            regs = [int.from_bytes(bv, byteorder="big")]
+            regs = [int_u]
 
     return regs
 
 
+# Modbus exception codes -> descriptions for GUI error messages
+_MODBUS_EXC_CODES = {
+    1: "Illegal function",
+    2: "Illegal data address",
+    3: "Illegal data value",
+    4: "Slave device failure",
+    5: "Acknowledge (request accepted, processing)",
+    6: "Slave device busy",
+    8: "Memory parity error",
+    10: "Gateway path unavailable",
+    11: "Gateway target device failed to respond",
+}
+
+_MISSING = object()
+
+
+def _raise_for_error_response(response) -> None:
+    """Raise RuntimeError with a readable message for a Modbus error response."""
+    # Single getattr lookups instead of hasattr + attribute access
+    is_error = getattr(response, "isError", None)
+    if is_error is None or not is_error():
+        return
+    code = getattr(response, "exception_code", _MISSING)
+    if code is _MISSING:
+        raise RuntimeError("Modbus protocol error")
+    raise RuntimeError(f"Modbus exception {code}: {_MODBUS_EXC_CODES.get(code, 'Unknown error')}")
+
+
+# Connected TCP clients are kept per URI for a short idle window so that
+# repeated reads/writes and monitor polls skip the connect handshake. Serial
+# ports are exclusive, so serial clients are closed after every operation.
+_CLIENT_IDLE_TTL = 5.0
+_client_cache: Dict[str, list] = {}  # uri -> [client or None, lock, last_used]
+_client_cache_lock = threading.Lock()
+# URIs held open regardless of idle time (e.g. by a slow monitor) -> holders
+_client_pins: Dict[str, int] = {}
+
+
+@lru_cache(maxsize=64)
+def _client_params(uri: str) -> Tuple[str, tuple, str, str]:
+    """Parse a connection URI once into create_client arguments.
+
+    Returns (kind, kwargs items, description, connect failure message).
+    """
+    parsed = urlparse(uri)
+    scheme = parsed.scheme or "serial"
+    qs = parse_qs(parsed.query or "")
+    if scheme == "serial":
+        netloc = parsed.netloc or parsed.path.lstrip("/")
+        if ":" in netloc:
+            port, baud_s = netloc.split(":", 1)
+            try:
+                baud = int(baud_s)
+            except Exception:
+                baud = int(qs.get("baud", ["9600"])[0])
+        else:
+            port = netloc or qs.get("port", [""])[0]
+            baud = int(qs.get("baud", ["9600"])[0])
+        return (
+            "serial",
+            (("serial_port", port), ("baudrate", baud)),
+            f"serial client for {port}",
+            f"Failed to connect to serial port {port} at {baud} baud. Check port name and permissions.",
+        )
+    host = parsed.hostname or "127.0.0.1"
+    tcp_port = parsed.port or int(qs.get("port", ["502"])[0])
+    return (
+        "tcp",
+        (("host", host), ("port", tcp_port)),
+        f"TCP client for {host}:{tcp_port}",
+        f"Failed to connect to {host}:{tcp_port}. Check host/port and network connectivity.",
+    )
+
+
+def _close_quietly(client) -> None:
+    try:
+        close_client(client)
+    except Exception:
+        pass
+
+
+def _connect_client(uri: str):
+    """Create and connect a client for `uri`, raising RuntimeError on failure."""
+    kind, kwargs, description, connect_failed = _client_params(uri)
+    try:
+        client = create_client(kind=kind, **dict(kwargs))
+    except Exception as e:
+        raise RuntimeError(f"Failed to create {description}: {e}")
+    try:
+        connected = client.connect()
+    except Exception as e:
+        _close_quietly(client)
+        raise RuntimeError(f"Connection error: {e}")
+    if not connected:
+        _close_quietly(client)
+        raise RuntimeError(connect_failed)
+    if kind == "tcp":
+        # Requests are tiny and strictly request/response; don't let Nagle hold them
+        sock = getattr(client, "socket", None)
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+    return client
+
+
+@contextmanager
+def _gui_client(uri: str):
+    """Yield a connected client for `uri`, reusing a recently used TCP one.
+
+    Access is serialized per URI because the sync clients are not
+    thread-safe. Any exception drops the client so the next call reconnects.
+    """
+    keep_alive = _client_params(uri)[0] == "tcp"
+    with _client_cache_lock:
+        entry = _client_cache.setdefault(uri, [None, threading.Lock(), 0.0])
+    with entry[1]:
+        client = entry[0]
+        if client is not None and time.monotonic() - entry[2] > _CLIENT_IDLE_TTL and uri not in _client_pins:
+            _close_quietly(client)
+            client = entry[0] = None
+        if client is None:
+            client = entry[0] = _connect_client(uri)
+        try:
+            yield client
+        except BaseException:
+            entry[0] = None
+            _close_quietly(client)
+            raise
+        finally:
+            entry[2] = time.monotonic()
+        if not keep_alive:
+            # Release the port so a probe or another tool can open it
+            entry[0] = None
+            _close_quietly(client)
+
+
+# Dedicated pool for GUI Modbus I/O so reads/writes never queue behind the
+# probe's many blocking attempts on asyncio's default executor.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="umdt-io")
+
+
+def _write_probe_json(path: str, results: Sequence[ProbeResult], pretty: bool = False) -> None:
+    """Write probe results to `path` as a JSON list (compact unless `pretty`).
+
+    Uses orjson when installed and streams through the stdlib encoder otherwise.
+    """
+    rows = [
+        {"uri": pr.uri, "alive": pr.alive, "summary": pr.response_summary, "elapsed_ms": pr.elapsed_ms}
+        for pr in results
+    ]
+    if orjson is not None:
+        # Encodes the whole list in C straight to UTF-8 bytes
+        data = orjson.dumps(rows, option=orjson.OPT_INDENT_2 if pretty else 0)
+        with open(path, "wb") as fh:
+            fh.write(data)
+        return
+    if pretty:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as fh:
+        for chunk in encoder.iterencode(rows):
+            fh.write(chunk)
+
+
+def _enumerate_serial_ports() -> List[Tuple[str, str]]:
+    """Return (device, description) for local serial ports; may block."""
+    try:
+        return [(p.device, p.description) for p in list_ports.comports()]
+    except Exception:
+        return []
+
+
+async def _run_io(func, *args):
+    """Run a blocking Modbus worker off the GUI thread and await its result."""
+    return await asyncio.get_running_loop().run_in_executor(_IO_EXECUTOR, func, *args)
+
+
+def close_gui_clients(idle_only: bool = False) -> None:
+    """Close cached GUI clients that are not in use.
+
+    With `idle_only`, only clients unused for longer than the TTL are closed.
+    """
+    now = time.monotonic()
+    with _client_cache_lock:
+        entries = list(_client_cache.items())
+    for uri, entry in entries:
+        if idle_only and uri in _client_pins:
+            continue
+        # Never block the GUI thread: busy clients are reaped on a later pass
+        if not entry[1].acquire(blocking=False):
+            continue
+        try:
+            if entry[0] is not None and (not idle_only or now - entry[2] > _CLIENT_IDLE_TTL):
+                _close_quietly(entry[0])
+                entry[0] = None
+        finally:
+            entry[1].release()
+
+
+@contextmanager
+def _pinned_gui_client(uri: str):
+    """Keep the cached client for `uri` open past the idle TTL while active.
+
+    Used by the monitor, whose poll interval may exceed the TTL; a client
+    dropped after an error is still reconnected on the next use. Serial
+    clients are never kept, pinned or not.
+    """
+    with _client_cache_lock:
+        _client_pins[uri] = _client_pins.get(uri, 0) + 1
+    try:
+        yield
+    finally:
+        with _client_cache_lock:
+            if _client_pins[uri] <= 1:
+                del _client_pins[uri]
+            else:
+                _client_pins[uri] -= 1
+
+
+# pymodbus read method name (DataTypeProperties.pymodbus_read_method) -> compat wrapper
+_READERS = {
+    'read_holding_registers': read_holding_registers,
+    'read_input_registers': read_input_registers,
+    'read_coils': read_coils,
+    'read_discrete_inputs': read_discrete_inputs,
+}
+
+
 def run_gui_read(
     uri: str,
     address: int,
@@ -430,61 +964,26 @@ def run_gui_read(
     
     Raises RuntimeError with user-friendly messages on errors.
     """
+    values = run_gui_read_raw(uri, address, value_count, long_mode, data_type, unit)
+    return _build_rows_from_values(values, data_type, address, value_count, long_mode, endian, decode)
 
-    from urllib.parse import urlparse, parse_qs
-
-    parsed = urlparse(uri)
-    scheme = parsed.scheme or "serial"
-    qs = parse_qs(parsed.query or "")
 
-    # Parse connection details
-    client = None
-    try:
-        if scheme == "serial":
-            netloc = parsed.netloc or parsed.path.lstrip("/")
-            if ":" in netloc:
-                port, baud_s = netloc.split(":", 1)
-                try:
-                    baud = int(baud_s)
-                except Exception:
-                    baud = int(qs.get("baud", ["9600"])[0])
-            else:
-                port = netloc or qs.get("port", [""])[0]
-                baud = int(qs.get("baud", ["9600"])[0])
-            try:
-                client = create_client(kind="serial", serial_port=port, baudrate=baud)
-            except Exception as e:
-                raise RuntimeError(f"Failed to create serial client for {port}: {e}")
-        else:
-            host = parsed.hostname or "127.0.0.1"
-            tcp_port = parsed.port or int(qs.get("port", ["502"])[0])
-            try:
-                client = create_client(kind="tcp", host=host, port=tcp_port)
-            except Exception as e:
-                raise RuntimeError(f"Failed to create TCP client for {host}:{tcp_port}: {e}")
+def run_gui_read_raw(
+    uri: str,
+    address: int,
+    value_count: int,
+    long_mode: bool,
+    data_type: DataType,
+    unit: int,
+) -> List[Union[int, bool]]:
+    """Blocking worker returning the raw register/bit values of a Modbus read.
 
-        # Connect to device
-        try:
-            connected = client.connect()
-        except Exception as e:
-            raise RuntimeError(f"Connection error: {e}")
-        
-        if not connected:
-            if scheme == "serial":
-                raise RuntimeError(f"Failed to connect to serial port {port} at {baud} baud. Check port name and permissions.")
-            else:
-                raise RuntimeError(f"Failed to connect to {host}:{tcp_port}. Check host/port and network connectivity.")
-    except Exception:
-        # Ensure any partially-created client is closed
-        try:
-            close_client(client)
-        except Exception:
-            pass
-        raise
+    Used where no decoding is needed (e.g. monitor polling) so callers avoid
+    building ReadRow objects. Raises RuntimeError like `run_gui_read`.
+    """
 
     props = DATA_TYPE_PROPERTIES[data_type]
     if not props.readable or not props.pymodbus_read_method:
-        client.close()
         raise RuntimeError(f"Data type {data_type.value} cannot be read")
 
     total_count = value_count
@@ -493,51 +992,20 @@ def run_gui_read(
     else:
         total_count = max(1, value_count)
 
-    # Perform read using compat wrappers
-    try:
-        _read_map = {
-            'read_holding_registers': read_holding_registers,
-            'read_input_registers': read_input_registers,
-            'read_coils': read_coils,
-            'read_discrete_inputs': read_discrete_inputs,
-        }
-        reader = _read_map.get(props.pymodbus_read_method)
-        if reader:
-            response = reader(client, address, total_count, unit)
-        else:
-            # Fall back to compatibility helper invocation if mapping missing
-            response = invoke_method(client, props.pymodbus_read_method, address, total_count, unit)
-    except Exception as e:
-        try:
-            close_client(client)
-        except Exception:
-            pass
-        raise RuntimeError(f"Modbus read error: {e}")
-    finally:
+    # Perform read using compat wrappers on a (possibly reused) client
+    with _gui_client(uri) as client:
         try:
-            close_client(client)
-        except Exception:
-            pass
+            reader = _READERS.get(props.pymodbus_read_method)
+            if reader:
+                response = reader(client, address, total_count, unit)
+            else:
+                # Fall back to compatibility helper invocation if mapping missing
+                response = invoke_method(client, props.pymodbus_read_method, address, total_count, unit)
+        except Exception as e:
+            raise RuntimeError(f"Modbus read error: {e}")
 
     # Check response for protocol errors
-    if hasattr(response, 'isError') and response.isError():
-        # Try to extract exception code for better error messages
-        error_msg = "Modbus protocol error"
-        if hasattr(response, 'exception_code'):
-            code = response.exception_code
-            error_codes = {
-                1: "Illegal function",
-                2: "Illegal data address",
-                3: "Illegal data value",
-                4: "Slave device failure",
-                5: "Acknowledge (request accepted, processing)",
-                6: "Slave device busy",
-                8: "Memory parity error",
-                10: "Gateway path unavailable",
-                11: "Gateway target device failed to respond",
-            }
-            error_msg = f"Modbus exception {code}: {error_codes.get(code, 'Unknown error')}"
-        raise RuntimeError(error_msg)
+    _raise_for_error_response(response)
 
     # Extract values from response
     values = None
@@ -552,7 +1020,18 @@ def run_gui_read(
     if not values:
         raise RuntimeError(f"Read returned no data. Check address {address} and unit ID {unit}.")
 
-    return _build_rows_from_values(values, data_type, address, value_count, long_mode, endian, decode)
+    return values
+
+
+def _pack_be_words(values: Sequence[Union[int, bool]]) -> bytes:
+    """Pack register values as big-endian words in one call.
+
+    Values from the device are already 0..0xFFFF; anything else is masked.
+    """
+    try:
+        return struct.pack(f">{len(values)}H", *values)
+    except struct.error:
+        return struct.pack(f">{len(values)}H", *[int(v) & 0xFFFF for v in values])
 
 
 def _build_rows_from_values(
@@ -583,61 +1062,45 @@ def _build_rows_from_values(
             )
         return rows
 
-    regs = [int(v) & 0xFFFF for v in values]
-    import struct
-
     if long_mode and decode:
-        for i in range(max(1, value_count)):
+        # Decode every complete pair in one struct pass
+        pairs = min(max(1, value_count), len(values) // 2)
+        wire = _pack_be_words(values[: pairs * 2])
+        _raw, i32s, f32s = unpack_register_pairs(struct.unpack(f">{pairs * 2}H", wire), e_norm)
+        # Hex of the registers as read (wire order), sliced 8 digits per pair
+        hex_all = wire.hex().upper()
+        for i in range(pairs):
             ri = i * 2
-            if ri + 1 >= len(regs):
-                break
-            b1 = regs[ri].to_bytes(2, byteorder="big")
-            b2 = regs[ri + 1].to_bytes(2, byteorder="big")
-            bv = b1 + b2
-            if e_norm == "big":
-                raw_be = bv
-            elif e_norm == "little":
-                raw_be = bv[::-1]
-            elif e_norm == "mid-big":
-                raw_be = bytes([bv[2], bv[3], bv[0], bv[1]])
-            else:
-                raw_be = bytes([bv[1], bv[0], bv[3], bv[2]])
-            try:
-                i32 = int.from_bytes(raw_be, byteorder="big", signed=True)
-            except Exception:
-                i32 = 0
-            try:
-                f32 = struct.unpack("!f", raw_be)[0]
-            except Exception:
-                f32 = None
-            hexv = "0x" + bv.hex().upper()
             rows.append(
                 ReadRow(
                     index=str(address + ri),
-                    hex_value=hexv,
-                    int_value=i32,
-                    float16=f32,
+                    hex_value="0x" + hex_all[i * 8 : i * 8 + 8],
+                    int_value=i32s[i],
+                    float16=f32s[i],
                     data_type=data_type,
                 )
             )
         return rows
 
-    for i, r in enumerate(regs[: value_count * (2 if long_mode else 1)]):
-        idx = str(address + i)
-        b = r.to_bytes(2, byteorder="big", signed=False)
-        hexv = "0x" + b.hex().upper()
-        bb = b[::-1] if e_norm == "little" else b
-        u = int.from_bytes(bb, byteorder="big", signed=False)
-        i16 = u if u < 0x8000 else u - 0x10000
-        try:
-            f16 = from_bytes_to_float16(bb)
-        except Exception:
-            f16 = None
+    wire = _pack_be_words(values[: value_count * (2 if long_mode else 1)])
+    n = len(wire) // 2
+    hex_all = wire.hex().upper()
+    # Reading the big-endian wire words as little-endian is the byte swap
+    little = e_norm == "little"
+    order = "<" if little else ">"
+    i16s = struct.unpack(f"{order}{n}h", wire)
+    f16s = struct.unpack(f"{order}{n}e", wire)
+    for i in range(n):
+        f16 = f16s[i]
+        if not math.isfinite(f16):
+            # Keep the "OVERFLOW" / "SENSOR FAULT" labels for Inf/NaN
+            b = wire[i * 2 : i * 2 + 2]
+            f16 = from_bytes_to_float16(b[::-1] if little else b)
         rows.append(
             ReadRow(
-                index=idx,
-                hex_value=hexv,
-                int_value=i16,
+                index=str(address + i),
+                hex_value="0x" + hex_all[i * 4 : i * 4 + 4],
+                int_value=i16s[i],
                 float16=f16,
                 data_type=data_type,
             )
@@ -660,243 +1123,59 @@ def run_gui_write(
 
     This mirrors a subset of the CLI write validation and encoding logic.
     """
-    import math
-    import struct
-    from urllib.parse import urlparse, parse_qs
-
-    # Parse and validate value
-    is_hex = value_text.strip().lower().startswith("0x")
-
-    if float_mode:
-        if is_hex:
-            raise ValueError("Hex values are not allowed with float mode")
-        try:
-            float_val = float(value_text)
-        except Exception:
-            raise ValueError("Value must be a float when using float mode")
-    else:
-        try:
-            int_val = int(value_text, 0)
-        except Exception:
-            raise ValueError("Value must be an integer or 0xHEX")
-
-        if int_val < 0:
-            signed = True
-
-        if long_mode:
-            if signed:
-                if int_val < -0x80000000 or int_val > 0x7FFFFFFF:
-                    raise ValueError("Value out of 32-bit signed range")
-            else:
-                if int_val < 0 or int_val > 0xFFFFFFFF:
-                    raise ValueError("Value out of 32-bit unsigned range")
-        else:
-            if signed:
-                if int_val < -0x8000 or int_val > 0x7FFF:
-                    raise ValueError("Value out of 16-bit signed range")
-            else:
-                if int_val < 0 or int_val > 0xFFFF:
-                    raise ValueError("Value out of 16-bit unsigned range")
-
-    # Build register payload
-    if float_mode:
-        if long_mode:
-            raw_be = struct.pack("!f", float_val)
-            if endian == "big":
-                bv = raw_be
-            elif endian == "little":
-                bv = raw_be[::-1]
-            elif endian == "mid-big":
-                bv = bytes([raw_be[2], raw_be[3], raw_be[0], raw_be[1]])
-            else:  # mid-little
-                bv = bytes([raw_be[1], raw_be[0], raw_be[3], raw_be[2]])
-            regs = [int.from_bytes(bv[0:2], byteorder="big"), int.from_bytes(bv[2:4], byteorder="big")]
-        else:
-            # 16-bit float encoding (same as CLI)
-            f = float_val
-            if math.isnan(f):
-                half = 0x7E00
-            elif math.isinf(f):
-                half = 0x7C00 if f > 0 else 0xFC00
-            else:
-                sign = 0
-                if f < 0:
-                    sign = 0x8000
-                    f = -f
-                if f == 0.0:
-                    half = sign
-                else:
-                    exp = int(math.floor(math.log(f, 2)))
-                    frac = f / (2 ** exp) - 1.0
-                    exp16 = exp + 15
-                    if exp16 <= 0:
-                        mant16 = int(round(f / (2 ** -24)))
-                        half = sign | mant16
-                    elif exp16 >= 0x1F:
-                        half = sign | 0x7C00
-                    else:
-                        mant16 = int(round(frac * (1 << 10)))
-                        if mant16 == (1 << 10):
-                            exp16 += 1
-                            mant16 = 0
-                            if exp16 >= 0x1F:
-                                half = sign | 0x7C00
-                            else:
-                                half = sign | (exp16 << 10) | (mant16 & 0x3FF)
-                        else:
-                            half = sign | (exp16 << 10) | (mant16 & 0x3FF)
-
-            b = half.to_bytes(2, byteorder="big")
-            if endian == "little":
-                b = b[::-1]
-            regs = [int.from_bytes(b, byteorder="big")]
-    else:
-        width_bits = 32 if long_mode else 16
-        if signed:
-            max_val = 1 << width_bits
-            int_u = int_val & (max_val - 1)
-        else:
-            int_u = int_val
-        byte_len = width_bits // 8
-        bv = int_u.to_bytes(byte_len, byteorder="big", signed=False)
-        if long_mode:
-            if endian == "big":
-                pass
-            elif endian == "little":
-                bv = bv[::-1]
-            elif endian == "mid-big":
-                bv = bytes([bv[2], bv[3], bv[0], bv[1]])
-            else:
-                bv = bytes([bv[1], bv[0], bv[3], bv[2]])
-            regs = [int.from_bytes(bv[0:2], byteorder="big"), int.from_bytes(bv[2:4], byteorder="big")]
-        else:
-            if endian == "little":
-                bv = bv[::-1]
-            regs = [int.from_bytes(bv, byteorder="big")]
+    # Parse, validate and encode the value (shared with the Interact tab)
+    regs = encode_value_to_registers(value_text, long_mode, endian, float_mode, signed)
 
     # Validate data type is writable
     props = DATA_TYPE_PROPERTIES[data_type]
     if not props.writable or not props.pymodbus_write_method:
         raise RuntimeError(f"Data type {data_type.value} cannot be written")
 
-    parsed = urlparse(uri)
-    scheme = parsed.scheme or "serial"
-    qs = parse_qs(parsed.query or "")
-
-    client = None
-    try:
-        if scheme == "serial":
-            netloc = parsed.netloc or parsed.path.lstrip("/")
-            if ":" in netloc:
-                port, baud_s = netloc.split(":", 1)
-                try:
-                    baud = int(baud_s)
-                except Exception:
-                    baud = int(qs.get("baud", ["9600"])[0])
-            else:
-                port = netloc or qs.get("port", [""])[0]
-                baud = int(qs.get("baud", ["9600"])[0])
-            try:
-                client = create_client(kind="serial", serial_port=port, baudrate=baud)
-            except Exception as e:
-                raise RuntimeError(f"Failed to create serial client for {port}: {e}")
-        else:
-            host = parsed.hostname or "127.0.0.1"
-            tcp_port = parsed.port or int(qs.get("port", ["502"])[0])
-            try:
-                client = create_client(kind="tcp", host=host, port=tcp_port)
-            except Exception as e:
-                raise RuntimeError(f"Failed to create TCP client for {host}:{tcp_port}: {e}")
-
-        # Connect
-        try:
-            connected = client.connect()
-        except Exception as e:
-            raise RuntimeError(f"Connection error: {e}")
-        
-        if not connected:
-            if scheme == "serial":
-                raise RuntimeError(f"Failed to connect to serial port {port} at {baud} baud. Check port name and permissions.")
-            else:
-                raise RuntimeError(f"Failed to connect to {host}:{tcp_port}. Check host/port and network connectivity.")
-    except Exception:
+    # Perform write using compat wrappers on a (possibly reused) client
+    with _gui_client(uri) as client:
         try:
-            close_client(client)
-        except Exception:
-            pass
-        raise
-
-    # Perform write using compat wrappers
-    try:
-        # For coils, convert register values to boolean list
-        if data_type == DataType.COIL:
-            # Convert register values to boolean list
-            bit_values = []
-            for reg in regs:
-                # Extract bits from register
-                for bit_pos in range(16):
-                    if len(bit_values) >= (1 if not long_mode else 32):
-                        break
-                    bit_values.append(bool((reg >> bit_pos) & 1))
-            # If single bit, use write_coil, else write_coils
-            if len(bit_values) == 1:
-                res = write_coil(client, address, bit_values[0], unit)
-            else:
-                res = write_coils(client, address, bit_values, unit)
-        else:
-            # For registers, use appropriate write method
-            if long_mode or (float_mode and len(regs) == 2) or len(regs) > 1:
-                res = write_registers(client, address, regs, unit)
+            # For coils, convert register values to boolean list
+            if data_type == DataType.COIL:
+                # Convert register values to boolean list (LSB first), capped
+                # at one coil, or 32 in long mode
+                limit = 32 if long_mode else 1
+                bit_values = [bool((reg >> bit_pos) & 1) for reg in regs for bit_pos in range(16)][:limit]
+                # If single bit, use write_coil, else write_coils
+                if len(bit_values) == 1:
+                    res = write_coil(client, address, bit_values[0], unit)
+                else:
+                    res = write_coils(client, address, bit_values, unit)
             else:
-                # Single register write
-                if props.pymodbus_write_method == 'write_registers':
-                    res = write_register(client, address, regs[0], unit)
+                # For registers, use appropriate write method
+                if long_mode or (float_mode and len(regs) == 2) or len(regs) > 1:
+                    res = write_registers(client, address, regs, unit)
                 else:
-                    # Try mapping common names, otherwise call attribute directly
-                    if props.pymodbus_write_method == 'write_register':
+                    # Single register write
+                    if props.pymodbus_write_method == 'write_registers':
                         res = write_register(client, address, regs[0], unit)
                     else:
-                        # Use compatibility helper for non-standard write method names
-                        res = invoke_method(client, props.pymodbus_write_method, address, regs, unit)
-        
-        # Check for protocol errors
-        if hasattr(res, "isError") and res.isError():
-            error_msg = "Modbus protocol error"
-            if hasattr(res, 'exception_code'):
-                code = res.exception_code
-                error_codes = {
-                    1: "Illegal function",
-                    2: "Illegal data address",
-                    3: "Illegal data value",
-                    4: "Slave device failure",
-                    5: "Acknowledge (request accepted, processing)",
-                    6: "Slave device busy",
-                    8: "Memory parity error",
-                    10: "Gateway path unavailable",
-                    11: "Gateway target device failed to respond",
-                }
-                error_msg = f"Modbus exception {code}: {error_codes.get(code, 'Unknown error')}"
-            raise RuntimeError(error_msg)
-        return True, "Write OK"
-    except RuntimeError:
-        raise
-    except Exception as e:
-        try:
-            close_client(client)
-        except Exception:
-            pass
-        raise RuntimeError(f"Modbus write error: {e}")
-    finally:
-        try:
-            close_client(client)
-        except Exception:
-            pass
+                        # Try mapping common names, otherwise call attribute directly
+                        if props.pymodbus_write_method == 'write_register':
+                            res = write_register(client, address, regs[0], unit)
+                        else:
+                            # Use compatibility helper for non-standard write method names
+                            res = invoke_method(client, props.pymodbus_write_method, address, regs, unit)
+        except Exception as e:
+            raise RuntimeError(f"Modbus write error: {e}")
+
+    # Check for protocol errors
+    _raise_for_error_response(res)
+    return True, "Write OK"
+
 
 # project icon (placed next to main scripts or bundled by PyInstaller into _MEIPASS)
 _RESOURCE_BASE = getattr(sys, '_MEIPASS', os.path.dirname(__file__))
 ICON_PATH = os.path.join(_RESOURCE_BASE, "umdt.ico")
 
 class MainWindow(QMainWindow):
+    # Signal to bridge serial port enumeration back to the GUI thread
+    serial_ports_found = Signal(list)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("UMDT")
@@ -963,18 +1242,23 @@ class MainWindow(QMainWindow):
         conn_row.addWidget(self.unit_edit)
 
         self.datatype_combo = QComboBox()
-        for dtype in (DataType.HOLDING, DataType.INPUT, DataType.COIL, DataType.DISCRETE):
-            props = DATA_TYPE_PROPERTIES[dtype]
-            self.datatype_combo.addItem(props.label)
-        # Store mapping separately since QComboBox userData can be unreliable
-        self._datatype_map = {
-            0: DataType.HOLDING,
-            1: DataType.INPUT,
-            2: DataType.COIL,
-            3: DataType.DISCRETE,
-        }
+        # Combo index maps onto _DATATYPE_ORDER since QComboBox userData can be unreliable
+        for dtype in _DATATYPE_ORDER:
+            self.datatype_combo.addItem(DATA_TYPE_PROPERTIES[dtype].label)
         conn_row.addWidget(QLabel("Type:"))
         conn_row.addWidget(self.datatype_combo)
+        # Data type and unit are read on every request; re-parse only on edits
+        self._cached_data_type: Optional[DataType] = None
+        self._cached_unit: Optional[int] = None
+        self.datatype_combo.currentIndexChanged.connect(self._invalidate_type_cache)
+        self.unit_edit.textChanged.connect(self._invalidate_type_cache)
+        # Last URI built from the connection panel, dropped on any edit
+        self._uri_cache: Optional[str] = None
+        for combo in (self.conn_type_combo, self.serial_port_combo):
+            combo.currentIndexChanged.connect(self._invalidate_uri_cache)
+            combo.currentTextChanged.connect(self._invalidate_uri_cache)
+        for edit in (self.unit_edit, self.baud_edit, self.host_edit, self.tcp_port_edit):
+            edit.textChanged.connect(self._invalidate_uri_cache)
 
         self.btn_connect = QPushButton("Connect")
         self.btn_connect.clicked.connect(self.on_connect_clicked)
@@ -987,7 +1271,9 @@ class MainWindow(QMainWindow):
 
         # Wire up connection type change to toggle serial/TCP inputs
         self.conn_type_combo.currentIndexChanged.connect(self.on_conn_type_changed)
-        # Populate serial ports now
+        # Populate serial ports; enumeration runs on the I/O pool
+        self._serial_scan_running = False
+        self.serial_ports_found.connect(self._populate_serial_ports)
         self.refresh_serial_ports()
         # Initialize visibility
         self.on_conn_type_changed(self.conn_type_combo.currentIndex())
@@ -1006,15 +1292,16 @@ class MainWindow(QMainWindow):
         # Build Interact tab layout (Read / Write panels)
         self._build_interact_tab()
 
-        # Build Monitor tab layout
-        self._build_monitor_tab()
-
-        # Build Scan tab layout
-        self._build_scan_tab()
-        # Build Probe tab layout
-        self._build_probe_tab()
+        # The other tabs are built the first time they are shown
+        self._pending_tab_builders = {
+            self.monitor_tab: self._build_monitor_tab,
+            self.scan_tab: self._build_scan_tab,
+            self.probe_tab: self._build_probe_tab,
+        }
 
         root_layout.addWidget(self.tabs)
+        # Details panes skip decoding while hidden; refresh them when shown
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # Lightweight log view below tabs
         self.log_view = QTextEdit()
@@ -1026,48 +1313,81 @@ class MainWindow(QMainWindow):
         self._read_lock = asyncio.Lock()
         # Monitor polling task
         self._monitor_task: Optional[asyncio.Task] = None
+        # Polling pauses while nobody can see the Monitor tab; set to resume
+        self._monitor_shown = asyncio.Event()
+        # Set to end the poll loop between polls, never mid-transaction
+        self._monitor_stop = asyncio.Event()
+        # Release kept-alive clients (serial ports, sockets) once idle
+        self._client_reaper = QTimer(self)
+        self._client_reaper.timeout.connect(lambda: close_gui_clients(idle_only=True))
+        self._client_reaper.start(int(_CLIENT_IDLE_TTL * 1000))
+        # Samples from the poll loop are added to the table (and scrolled
+        # to) at most once per frame
+        self._monitor_pending_samples: List[MonitorSample] = []
+        self._monitor_flush_scheduled = False
         # Scan task
         self._scan_task: Optional[asyncio.Task] = None
+        self._scan_cancel_event = asyncio.Event()
+        # Readable addresses waiting for the next batched table insert
+        self._scan_pending: List[int] = []
+        self._scan_flush_scheduled = False
+        # (uri, data type, unit, address) -> readable, cleared on Connect and
+        # Disconnect so rescanning an overlapping range skips addresses already found
+        self._scan_cache: Dict[Tuple[str, DataType, int, int], bool] = {}
+        # Probe run state
+        self._probe_task: Optional[asyncio.Task] = None
+        self._probe_cancel_event: Optional[asyncio.Event] = None
+        # Only alive results are kept; dead probes just bump the counter
+        self._probe_tested_count = 0
+        self._probe_alive_results: List[ProbeResult] = []
+        # Alive results waiting for the next batched table insert
+        self._probe_pending: List[ProbeResult] = []
+        self._probe_flush_scheduled = False
+        self._probe_total = 0
+        self._probe_status_ts = 0.0
         # Store connection state: None = disconnected, str = URI
         self._connection_uri: Optional[str] = None
 
     # --- Intent helpers ---
 
     def _normalize_endian(self, raw: str, allow_all: bool = False) -> Optional[str]:
-        e_str = (raw or "big").lower()
-        mapping = {
-            "b": "big",
-            "big": "big",
-            "l": "little",
-            "little": "little",
-            "mb": "mid-big",
-            "mid-big": "mid-big",
-            "ml": "mid-little",
-            "mid-little": "mid-little",
-        }
-        if allow_all:
-            mapping["all"] = "all"
-        return mapping.get(e_str)
+        mapping = _ENDIAN_MAP_ALL if allow_all else _ENDIAN_MAP
+        return mapping.get((raw or "big").lower())
 
     def _parse_address(self, text: str) -> Optional[int]:
-        if not text:
-            return None
-        try:
-            return int(text.strip(), 0)
-        except Exception:
-            return None
+        return self._parse_int(text)
 
     def _parse_int(self, text: str) -> Optional[int]:
         if not text:
             return None
+        s = text.strip()
+        # Plain ASCII decimal is the common case; skip prefix detection for
+        # it. Leading zeros ("010") still go through int(s, 0), which rejects them
+        if s.isascii() and s.isdigit() and (len(s) == 1 or s[0] != "0"):
+            return int(s)
         try:
-            return int(text.strip(), 0)
+            return int(s, 0)
         except Exception:
             return None
 
+    def _invalidate_type_cache(self, *_args) -> None:
+        self._cached_data_type = None
+        self._cached_unit = None
+
+    def _invalidate_uri_cache(self, *_args) -> None:
+        self._uri_cache = None
+        # Clients for the previous settings are no longer wanted
+        close_gui_clients()
+
     def _current_data_type(self) -> DataType:
-        idx = self.datatype_combo.currentIndex()
-        return self._datatype_map.get(idx, DataType.HOLDING)
+        if self._cached_data_type is None:
+            self._cached_data_type = _datatype_at(self.datatype_combo.currentIndex())
+        return self._cached_data_type
+
+    def _current_unit(self) -> int:
+        if self._cached_unit is None:
+            self._cached_unit = self._parse_int(self.unit_edit.text()) or 1
+        return self._cached_unit
 
     def _build_interact_tab(self) -> None:
         layout = QVBoxLayout()
@@ -1119,11 +1439,15 @@ class MainWindow(QMainWindow):
 
         # Details table for selected read row: show decoding across endianness
         # Use full set of columns so 32-bit longs can display 32-bit interpretations
-        self.read_details_table = QTableWidget()
-        self.read_details_table.setColumnCount(9)
-        self.read_details_table.setHorizontalHeaderLabels(["Format", "Hex", "UInt16", "Int16", "Float16", "Hex32", "UInt32", "Int32", "Float32"])
+        self.read_details_model = DecodingTableModel()
+        self.read_details_table = QTableView()
+        self.read_details_table.setModel(self.read_details_model)
         self.read_details_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.read_details_table.setMaximumHeight(160)
+        # Column visibility last applied; only touched when the width flips
+        self._read_details_is_32: Optional[bool] = None
+        # Registers currently decoded in the pane; reselecting them is a no-op
+        self._read_details_regs: Optional[Tuple[int, ...]] = None
         layout.addWidget(self.read_details_table)
 
         # --- Write panel ---
@@ -1237,6 +1561,7 @@ class MainWindow(QMainWindow):
         # Hide vertical header (row numbers)
         try:
             self.monitor_table.verticalHeader().setVisible(False)
+            _use_fixed_row_height(self.monitor_table)
         except Exception:
             pass
         # Select individual cells for monitor and connect selection changed
@@ -1248,17 +1573,25 @@ class MainWindow(QMainWindow):
             pass
         header = self.monitor_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
+        # Follow new samples only while the view sits at the bottom, so
+        # scrolling up to inspect history isn't yanked back every poll
+        self._monitor_stick_to_bottom = True
+        scrollbar = self.monitor_table.verticalScrollBar()
+        scrollbar.valueChanged.connect(
+            lambda value: setattr(self, "_monitor_stick_to_bottom", value >= scrollbar.maximum())
+        )
         layout.addWidget(self.monitor_table)
         # Status label
         self.monitor_status_label = QLabel("Idle")
         layout.addWidget(self.monitor_status_label)
 
         # Details table for selected monitor row: show decoding across endianness
-        self.monitor_details_table = QTableWidget()
-        self.monitor_details_table.setColumnCount(9)
-        self.monitor_details_table.setHorizontalHeaderLabels(["Format", "Hex", "UInt16", "Int16", "Float16", "Hex32", "UInt32", "Int32", "Float32"])
+        self.monitor_details_model = DecodingTableModel()
+        self.monitor_details_table = QTableView()
+        self.monitor_details_table.setModel(self.monitor_details_model)
         self.monitor_details_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.monitor_details_table.setMaximumHeight(200)
+        self._monitor_details_is_32: Optional[bool] = None
         layout.addWidget(self.monitor_details_table)
 
         self.monitor_tab.setLayout(layout)
@@ -1267,15 +1600,6 @@ class MainWindow(QMainWindow):
         self.btn_monitor_start.clicked.connect(self.on_monitor_start_clicked)
         self.btn_monitor_stop.clicked.connect(self.on_monitor_stop_clicked)
         self.btn_monitor_clear.clicked.connect(self.on_monitor_clear_clicked)
-        # Selection handlers for details panels
-        try:
-            self.read_table.selectionModel().selectionChanged.connect(self.on_read_selection_changed)
-        except Exception:
-            pass
-        try:
-            self.monitor_table.selectionModel().selectionChanged.connect(self.on_monitor_selection_changed)
-        except Exception:
-            pass
 
     def _build_scan_tab(self) -> None:
         """Build the Scan tab UI with address range scanning."""
@@ -1316,14 +1640,16 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.scan_status_label)
 
         # --- Scan results table ---
-        self.scan_table = QTableWidget()
-        self.scan_table.setColumnCount(3)
-        self.scan_table.setHorizontalHeaderLabels(["Address (Dec)", "Address (Hex)", "Status"])
+        self.scan_model = ScanResultsModel()
+        self.scan_table = QTableView()
+        self.scan_table.setModel(self.scan_model)
+        # Fixed default widths so column sizing never walks the result rows
         header = self.scan_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(160)
+        header.setStretchLastSection(True)
         self.scan_table.verticalHeader().setVisible(False)
+        _use_fixed_row_height(self.scan_table)
         layout.addWidget(self.scan_table)
 
         self.scan_tab.setLayout(layout)
@@ -1369,9 +1695,8 @@ class MainWindow(QMainWindow):
         self.probe_addr_edit = QLineEdit("1")
         self.probe_addr_edit.setMaximumWidth(150)
         self.probe_datatype_combo = QComboBox()
-        for dtype in (DataType.HOLDING, DataType.INPUT, DataType.COIL, DataType.DISCRETE):
-            props = DATA_TYPE_PROPERTIES[dtype]
-            self.probe_datatype_combo.addItem(props.label)
+        for dtype in _DATATYPE_ORDER:
+            self.probe_datatype_combo.addItem(DATA_TYPE_PROPERTIES[dtype].label)
         self.probe_target_label = QLabel("Target address and type")
         target_row.addWidget(QLabel("Address:"))
         target_row.addWidget(self.probe_addr_edit)
@@ -1414,10 +1739,12 @@ class MainWindow(QMainWindow):
         self.btn_probe_stop.setEnabled(False)
         self.btn_probe_clear = QPushButton("Clear")
         self.btn_probe_export = QPushButton("Export JSON")
+        self.probe_pretty_checkbox = QCheckBox("Pretty JSON")
         controls_row.addWidget(self.btn_probe_start)
         controls_row.addWidget(self.btn_probe_stop)
         controls_row.addWidget(self.btn_probe_clear)
         controls_row.addWidget(self.btn_probe_export)
+        controls_row.addWidget(self.probe_pretty_checkbox)
         controls_row.addStretch()
         layout.addLayout(controls_row)
 
@@ -1426,21 +1753,21 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.probe_status_label)
 
         # --- Results table ---
-        self.probe_table = QTableWidget()
-        self.probe_table.setColumnCount(5)
-        self.probe_table.setHorizontalHeaderLabels(["URI", "Params", "Status", "Summary", "RTT (ms)"])
+        self.probe_model = ProbeResultsModel()
+        self.probe_table = QTableView()
+        self.probe_table.setModel(self.probe_model)
         self.probe_table.verticalHeader().setVisible(False)
+        _use_fixed_row_height(self.probe_table)
+        # Fixed default widths so column sizing never walks the result rows
         header = self.probe_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(160)
+        header.resizeSection(2, 80)
+        header.setStretchLastSection(True)
         layout.addWidget(self.probe_table)
 
         self.probe_tab.setLayout(layout)
 
-        # Internal state
-        self._probe_task: Optional[asyncio.Task] = None
-        self._probe_cancel_event: Optional[asyncio.Event] = None
-        self._probe_results: List[dict] = []
-
         # Wire buttons
         self.btn_probe_start.clicked.connect(self.on_probe_start_clicked)
         self.btn_probe_stop.clicked.connect(self.on_probe_stop_clicked)
@@ -1459,63 +1786,39 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Probe running", "A probe run is already in progress.")
             return
 
-        # Build parameter lists
-        hosts = expand_csv_or_range(self.probe_hosts_edit.text()) or []
-        ports = expand_csv_or_range(self.probe_ports_edit.text()) or []
-        serials = expand_csv_or_range(self.probe_serials_edit.text()) or []
-        bauds = expand_csv_or_range(self.probe_bauds_edit.text()) or []
-        units = expand_csv_or_range(self.probe_units_edit.text()) or ["1"]
-
-        # Compute Cartesian product size for safety
-        h = max(1, len(hosts))
-        p = max(1, len(ports))
-        s = max(1, len(serials))
-        u = max(1, len(units))
-        total = (h * p + s * len(bauds or [9600])) * u
-        if total > 5000:
-            res = QMessageBox.question(self, "Large probe", f"Probe will test ~{total} combinations. Continue?", QMessageBox.Yes | QMessageBox.No)
+        # Build parameter lists; numeric fields come back already parsed
+        hosts = _expand_probe_field(self.probe_hosts_edit.text())
+        ports = _expand_probe_field(self.probe_ports_edit.text(), _probe_number)
+        serials = _expand_probe_field(self.probe_serials_edit.text())
+        bauds = _expand_probe_field(self.probe_bauds_edit.text(), _probe_number)
+        units = _expand_probe_field(self.probe_units_edit.text(), _probe_unit) or (1,)
+
+        # Read the top-bar defaults once, before any combinations are built
+        if hosts and not ports:
+            ports = (self._parse_int(self.tcp_port_edit.text()) or 502,)
+        if serials and not bauds:
+            bauds = (_probe_number(self.baud_edit.text() or "115200"),)
+
+        # Cartesian product size for safety; the product itself is built off the UI thread
+        target_count = (len(hosts) * len(ports) + len(serials) * len(bauds)) * len(units)
+        if target_count > 5000:
+            res = QMessageBox.question(self, "Large probe", f"Probe will test {target_count} combinations. Continue?", QMessageBox.Yes | QMessageBox.No)
             if res != QMessageBox.Yes:
                 return
 
-        # Prepare combinations list
-        combinations = []
-        # Add TCP combos
-        if hosts and ports:
-            for hh in hosts:
-                for pp in ports:
-                    for uu in units:
-                        try:
-                            combinations.append({"host": hh, "port": int(pp, 0), "unit": int(uu, 0)})
-                        except Exception:
-                            combinations.append({"host": hh, "port": pp, "unit": int(uu) if uu.isdigit() else 1})
-        elif hosts:
-            for hh in hosts:
-                for uu in units:
-                    try:
-                        combinations.append({"host": hh, "port": int(self.tcp_port_edit.text() or 502), "unit": int(uu, 0)})
-                    except Exception:
-                        combinations.append({"host": hh, "port": int(self.tcp_port_edit.text() or 502), "unit": int(uu) if uu.isdigit() else 1})
-
-        # Add serial combos
-        if serials:
-            for dev in serials:
-                for bd in (bauds or [self.baud_edit.text() or "115200"]):
-                    for uu in units:
-                        try:
-                            combinations.append({"serial": dev, "baud": int(bd, 0), "unit": int(uu, 0)})
-                        except Exception:
-                            combinations.append({"serial": dev, "baud": bd, "unit": int(uu) if uu.isdigit() else 1})
-
-        # If no explicit combos built, fallback to the built URI from top-bar inputs
-        if not combinations:
-            combinations = [self.build_uri()]
+        # If no explicit combos, fallback to the built URI from top-bar inputs
+        fallback = None if target_count else [
+            {"uri": self.build_uri(), "unit": self._current_unit()}
+        ]
+        if fallback:
+            target_count = 1
 
         # Setup Prober
         timeout_ms = int(self.probe_timeout_spin.value())
         concurrency = int(self.probe_concurrency_spin.value())
         attempts = int(self.probe_attempts_spin.value())
         backoff_ms = int(self.probe_backoff_spin.value())
-        datatype = self._datatype_map.get(self.probe_datatype_combo.currentIndex(), DataType.HOLDING)
+        datatype = _datatype_at(self.probe_datatype_combo.currentIndex())
         try:
             addr = int(self.probe_addr_edit.text().strip(), 0)
         except Exception:
@@ -1527,25 +1830,19 @@ class MainWindow(QMainWindow):
         prober = Prober(timeout_ms=timeout_ms, concurrency=concurrency, attempts=attempts, backoff_ms=backoff_ms)
 
         # Clear previous results
-        self.probe_table.setRowCount(0)
-        self._probe_results = []
+        self.probe_model.clear()
+        self._probe_tested_count = 0
+        self._probe_alive_results = []
+        self._probe_pending = []
+        self._probe_flush_scheduled = False
+        self._probe_total = target_count
+        self._probe_status_ts = 0.0
 
         # Create cancel event
         self._probe_cancel_event = asyncio.Event()
 
-        def _on_result(pr):
-            # Called in the same event loop; safe to update UI
-            # Track all results (for accurate count), but only show ALIVE in table
-            self._probe_results.append({"uri": pr.uri, "alive": pr.alive, "summary": pr.response_summary, "elapsed_ms": pr.elapsed_ms})
-            if pr.alive:
-                row = self.probe_table.rowCount()
-                self.probe_table.insertRow(row)
-                self.probe_table.setItem(row, 0, QTableWidgetItem(pr.uri))
-                self.probe_table.setItem(row, 1, QTableWidgetItem(str(pr.params)))
-                self.probe_table.setItem(row, 2, QTableWidgetItem("ALIVE"))
-                self.probe_table.setItem(row, 3, QTableWidgetItem(str(pr.response_summary)))
-                self.probe_table.setItem(row, 4, QTableWidgetItem(f"{pr.elapsed_ms:.1f}"))
-            self.probe_status_label.setText(f"Tested {len(self._probe_results)} / {len(combinations)} — found {sum(1 for r in self._probe_results if r['alive'])}")
+        # Workers only enqueue; a single consumer task records results
+        probe_queue: asyncio.Queue = asyncio.Queue()
 
         # Disable writes during probing
         try:
@@ -1556,19 +1853,33 @@ class MainWindow(QMainWindow):
         # Start probe task
         self.btn_probe_start.setEnabled(False)
         self.btn_probe_stop.setEnabled(True)
-        self.probe_status_label.setText(f"Probing {len(combinations)} targets...")
+        self.probe_status_label.setText(f"Probing {target_count} targets...")
 
         async def _run():
+            consumer = asyncio.create_task(self._drain_probe_queue(probe_queue))
             try:
-                await prober.run(combinations, target, on_result=_on_result, cancel_token=self._probe_cancel_event)
-                alive_count = sum(1 for r in self._probe_results if r['alive'])
-                self.probe_status_label.setText(f"Probe complete — tested {len(self._probe_results)}/{len(combinations)}, found {alive_count}")
+                combinations = fallback or await _run_io(
+                    _build_probe_combinations, hosts, ports, serials, bauds, units
+                )
+                await prober.run(combinations, target, on_result=probe_queue.put_nowait, cancel_token=self._probe_cancel_event)
+                probe_queue.put_nowait(None)
+                await consumer
+                self._flush_probe_results()
+                self.probe_status_label.setText(f"Probe complete — tested {self._probe_tested_count}/{target_count}, found {len(self._probe_alive_results)}")
             except asyncio.CancelledError:
-                self.probe_status_label.setText(f"Probe cancelled — tested {len(self._probe_results)}/{len(combinations)}")
+                consumer.cancel()
+                # Keep results that finished before the cancel
+                while not probe_queue.empty():
+                    pr = probe_queue.get_nowait()
+                    if pr is not None:
+                        self._record_probe_result(pr)
+                self._flush_probe_results()
+                self.probe_status_label.setText(f"Probe cancelled — tested {self._probe_tested_count}/{target_count}")
             except Exception as e:
                 self.probe_status_label.setText(f"Probe error: {e}")
                 QMessageBox.critical(self, "Probe Error", f"An error occurred during probe: {e}")
             finally:
+                consumer.cancel()
                 self.btn_probe_start.setEnabled(True)
                 self.btn_probe_stop.setEnabled(False)
                 try:
@@ -1576,6 +1887,8 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
 
+        # The prober opens its own clients; release any cached ones first
+        close_gui_clients()
         self._probe_task = asyncio.create_task(_run())
 
     @qasync.asyncSlot()
@@ -1597,25 +1910,60 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    async def _drain_probe_queue(self, queue: asyncio.Queue) -> None:
+        """Record queued probe results until the None sentinel arrives."""
+        while True:
+            pr = await queue.get()
+            if pr is None:
+                return
+            self._record_probe_result(pr)
+
+    def _record_probe_result(self, pr: ProbeResult) -> None:
+        # Count every result, but only keep and show ALIVE ones
+        self._probe_tested_count += 1
+        if pr.alive:
+            self._probe_alive_results.append(pr)
+            self._probe_pending.append(pr)
+        # Table inserts and the status text are applied in batches
+        if not self._probe_flush_scheduled:
+            self._probe_flush_scheduled = True
+            QTimer.singleShot(50, self._flush_probe_results)
+
+    def _flush_probe_results(self):
+        """Insert buffered alive results as one batch and refresh the status."""
+        if not self._probe_flush_scheduled:
+            return
+        self._probe_flush_scheduled = False
+        batch, self._probe_pending = self._probe_pending, []
+        if batch:
+            with _updates_suspended(self.probe_table):
+                self.probe_model.add_results(batch)
+        # Progress text is throttled further; the run posts its own final status
+        now = time.monotonic()
+        if now - self._probe_status_ts >= _PROBE_STATUS_INTERVAL:
+            self._probe_status_ts = now
+            self.probe_status_label.setText(f"Tested {self._probe_tested_count} / {self._probe_total} — found {len(self._probe_alive_results)}")
+
     def on_probe_clear_clicked(self):
-        self.probe_table.setRowCount(0)
-        self._probe_results = []
+        self.probe_model.clear()
+        self._probe_tested_count = 0
+        self._probe_alive_results = []
+        self._probe_pending = []
+        self._probe_flush_scheduled = False
         self.probe_status_label.setText("Idle")
 
-    def on_probe_export_clicked(self):
-        # Simple file chooser using Qt
-        from PySide6.QtWidgets import QFileDialog
-        if not self._probe_results:
-            QMessageBox.information(self, "No results", "No probe results to export.")
+    @qasync.asyncSlot()
+    async def on_probe_export_clicked(self):
+        if not self._probe_alive_results:
+            QMessageBox.information(self, "No results", "No responding targets to export.")
             return
         path, _ = QFileDialog.getSaveFileName(self, "Save probe results", "probe_results.json", "JSON Files (*.json);;All Files (*)")
         if not path:
             return
+        results = list(self._probe_alive_results)
         try:
-            import json
-            with open(path, "w", encoding="utf-8") as fh:
-                json.dump(self._probe_results, fh, indent=2)
-            QMessageBox.information(self, "Saved", f"Wrote {len(self._probe_results)} results to {path}")
+            await _run_io(_write_probe_json, path, results, self.probe_pretty_checkbox.isChecked())
+            QMessageBox.information(self, "Saved", f"Wrote {len(results)} responding of {self._probe_tested_count} tested targets to {path}")
         except Exception as e:
             QMessageBox.critical(self, "Export failed", f"Failed to write results: {e}")
 
@@ -1625,6 +1973,11 @@ class MainWindow(QMainWindow):
         This is a simple placeholder; later steps can refine this to match
         the ConnectionManager URI scheme (e.g. serial://, tcp://, mock://).
         """
+        if self._uri_cache is None:
+            self._uri_cache = self._compose_uri()
+        return self._uri_cache
+
+    def _compose_uri(self) -> str:
         conn_type = self.conn_type_combo.currentText().lower()
         unit = self.unit_edit.text().strip() or "1"
         if conn_type == "serial":
@@ -1648,11 +2001,14 @@ class MainWindow(QMainWindow):
             # Connect: store URI for use by read/write operations
             uri = self.build_uri()
             self._connection_uri = uri
+            self._scan_cache.clear()
             self.status_label.setText("Connected")
             self.btn_connect.setText("Disconnect")
         else:
-            # Disconnect: clear stored URI
+            # Disconnect: clear stored URI and release any kept-alive client
             self._connection_uri = None
+            close_gui_clients()
+            self._scan_cache.clear()
             self.status_label.setText("Disconnected")
             self.btn_connect.setText("Connect")
 
@@ -1675,18 +2031,29 @@ class MainWindow(QMainWindow):
                 pass
 
     def refresh_serial_ports(self):
-        """Discover serial ports and populate the combo box."""
+        """Discover serial ports in the background and populate the combo box."""
+        # Enumeration can take seconds on Windows; skip requests that overlap
+        # a running scan (e.g. the type-change signals during setup)
+        if self._serial_scan_running:
+            return
+        self._serial_scan_running = True
+
+        def _deliver(future):
+            try:
+                self.serial_ports_found.emit(future.result())
+            except RuntimeError:
+                # Window already destroyed
+                pass
+
+        _IO_EXECUTOR.submit(_enumerate_serial_ports).add_done_callback(_deliver)
+
+    def _populate_serial_ports(self, ports: list):
+        self._serial_scan_running = False
         self.serial_port_combo.clear()
-        try:
-            ports = list_ports.comports()
-            for p in ports:
-                # display device name (e.g., COM3) and description
-                display = p.device
-                if p.description:
-                    display = f"{p.device} — {p.description}"
-                self.serial_port_combo.addItem(display, userData=p.device)
-        except Exception:
-            ports = []
+        for device, description in ports:
+            # display device name (e.g., COM3) and description
+            display = f"{device} — {description}" if description else device
+            self.serial_port_combo.addItem(display, userData=device)
 
         # If no ports found, provide a sensible editable placeholder
         if not ports:
@@ -1745,7 +2112,7 @@ class MainWindow(QMainWindow):
                     QMessageBox.warning(self, "Invalid endian", "Select a valid endian option.")
                     return
 
-                unit = self._parse_int(self.unit_edit.text()) or 1
+                unit = self._current_unit()
 
                 # Validate Modbus PDU limits
                 if is_register_type(data_type):
@@ -1807,8 +2174,10 @@ class MainWindow(QMainWindow):
                     )
                 except Exception:
                     pass
+                # A kept selection now points at fresh data; redecode it
                 try:
-                    self.read_details.clear()
+                    if self.read_table.selectionModel().hasSelection():
+                        self.on_read_selection_changed()
                 except Exception:
                     pass
             finally:
@@ -1843,7 +2212,7 @@ class MainWindow(QMainWindow):
             return
 
         # Get unit ID and data type from connection panel
-        unit = self._parse_int(self.unit_edit.text()) or 1
+        unit = self._current_unit()
         data_type = self._current_data_type()
 
         # Validate data type is writable
@@ -1889,7 +2258,10 @@ class MainWindow(QMainWindow):
 
     def on_monitor_decode_changed(self, decoding: str):
         """Handle decoding scheme change - update table display."""
-        self.monitor_model.set_decoding(decoding)
+        view = self.monitor_table
+        top = view.rowAt(0)
+        bottom = view.rowAt(view.viewport().height() - 1)
+        self.monitor_model.set_decoding(decoding, top, bottom)
         # Refresh details panel if a row is selected
         try:
             sel = self.monitor_table.selectionModel().selectedRows()
@@ -1923,7 +2295,7 @@ class MainWindow(QMainWindow):
 
         # Get data type and unit
         data_type = self._current_data_type()
-        unit = self._parse_int(self.unit_edit.text()) or 1
+        unit = self._current_unit()
 
         # Check if already scanning
         if self._scan_task is not None and not self._scan_task.done():
@@ -1936,6 +2308,7 @@ class MainWindow(QMainWindow):
         self.scan_status_label.setText(f"Scanning {start_addr} to {end_addr}...")
 
         # Start scan task
+        self._scan_cancel_event = asyncio.Event()
         self._scan_task = asyncio.create_task(
             self._run_scan(start_addr, end_addr, data_type, unit)
         )
@@ -1944,6 +2317,7 @@ class MainWindow(QMainWindow):
     async def on_scan_stop_clicked(self):
         """Stop the current scan."""
         if self._scan_task is not None and not self._scan_task.done():
+            self._scan_cancel_event.set()
             self._scan_task.cancel()
             try:
                 await self._scan_task
@@ -1956,60 +2330,79 @@ class MainWindow(QMainWindow):
     @qasync.asyncSlot()
     async def on_scan_clear_clicked(self):
         """Clear scan results table."""
-        self.scan_table.setRowCount(0)
+        self.scan_model.clear()
+        self._scan_pending = []
+        self._scan_flush_scheduled = False
         self.scan_status_label.setText("Ready to scan")
 
     async def _run_scan(self, start_addr: int, end_addr: int, data_type: DataType, unit: int):
         """Perform the scan operation in background."""
         found_count = 0
         total_count = end_addr - start_addr + 1
-        
-        try:
-            for addr in range(start_addr, end_addr + 1):
-                # Check for cancellation
-                if self._scan_task.cancelled():
-                    break
-                
-                # Update status
-                progress = addr - start_addr + 1
+        chunk = _MAX_READ_BITS if is_bit_type(data_type) else _MAX_READ_REGISTERS
+        uri = self._connection_uri
+        # Without a connection reads go to the form's URI; key on it so
+        # editing host/port between scans does not reuse another device's results
+        target = uri or self.build_uri()
+        cancel = self._scan_cancel_event
+        cache = self._scan_cache
+
+        async def _readable(addr: int, count: int) -> bool:
+            try:
+                await self._read_rows(addr, count, False, "big", False, data_type, unit, uri)
+            except Exception:
+                return False
+            return True
+
+        last_yield = time.monotonic()
+
+        async def _progress(addr: int, found_so_far: int) -> None:
+            # Refresh the status and let Qt repaint once a frame, not per read
+            nonlocal last_yield
+            now = time.monotonic()
+            if now - last_yield >= _SCAN_YIELD_INTERVAL:
                 self.scan_status_label.setText(
-                    f"Scanning {progress}/{total_count} (found {found_count})..."
+                    f"Scanning {addr - start_addr + 1}/{total_count} (found {found_so_far})..."
                 )
-                
-                # Attempt to read single register/coil at this address
-                try:
-                    await self._read_rows(
-                        addr,
-                        1,  # count = 1
-                        False,  # long_mode = False
-                        "big",  # endian
-                        False,  # decode
-                        data_type,
-                        unit,
-                        self._connection_uri,
-                    )
-                    
-                    # Success - add to table
-                    found_count += 1
-                    row_position = self.scan_table.rowCount()
-                    self.scan_table.insertRow(row_position)
-                    self.scan_table.setItem(row_position, 0, QTableWidgetItem(str(addr)))
-                    self.scan_table.setItem(row_position, 1, QTableWidgetItem(hex(addr)))
-                    self.scan_table.setItem(row_position, 2, QTableWidgetItem("Readable"))
-                    
-                    # Color the row green
-                    for col in range(3):
-                        item = self.scan_table.item(row_position, col)
-                        if item:
-                            item.setBackground(QBrush(QColor(200, 255, 200)))
-                    
-                except Exception:
-                    # Silently ignore errors (address not readable)
-                    pass
-                
-                # Small delay to keep UI responsive
-                await asyncio.sleep(0.01)
-            
+                await asyncio.sleep(0)
+                last_yield = time.monotonic()
+
+        try:
+            for base in range(start_addr, end_addr + 1, chunk):
+                if cancel.is_set():
+                    break
+                count = min(chunk, end_addr - base + 1)
+                await _progress(base, found_count)
+
+                block = range(base, base + count)
+                if all((target, data_type, unit, addr) in cache for addr in block):
+                    # Found by an earlier scan since Connect; no need to ask again
+                    found = list(block)
+                # One request covers the block when every address in it is readable
+                elif await _readable(base, count):
+                    found = list(block)
+                else:
+                    # Something in the block failed; probe its addresses one by one
+                    found = []
+                    for addr in block:
+                        if cancel.is_set():
+                            break
+                        if (target, data_type, unit, addr) in cache:
+                            found.append(addr)
+                            continue
+                        await _progress(addr, found_count + len(found))
+                        if await _readable(addr, 1):
+                            found.append(addr)
+
+                if found:
+                    for addr in found:
+                        cache[(target, data_type, unit, addr)] = True
+                    found_count += len(found)
+                    self._scan_pending.extend(found)
+                    if not self._scan_flush_scheduled:
+                        self._scan_flush_scheduled = True
+                        QTimer.singleShot(50, self._flush_scan_results)
+
             # Scan complete
             self.scan_status_label.setText(
                 f"Scan complete. Found {found_count} readable address(es) out of {total_count}."
@@ -2022,57 +2415,43 @@ class MainWindow(QMainWindow):
             self.scan_status_label.setText(f"Scan error: {e}")
             QMessageBox.critical(self, "Scan Error", f"An error occurred during scan: {e}")
         finally:
+            self._flush_scan_results()
             self.btn_scan_start.setEnabled(True)
             self.btn_scan_stop.setEnabled(False)
 
+    def _flush_scan_results(self):
+        """Insert buffered readable addresses into the scan table as one batch."""
+        if not self._scan_flush_scheduled:
+            return
+        self._scan_flush_scheduled = False
+        batch, self._scan_pending = self._scan_pending, []
+        if batch:
+            with _updates_suspended(self.scan_table):
+                self.scan_model.add_addresses(batch)
+
     def _format_register_details(self, regs: List[int], start_addr: int, endian: str) -> str:
         """Format detailed decoding for a list of 16-bit registers."""
-        import struct
-
         lines = []
         lines.append(f"Start addr: {start_addr}")
         lines.append(f"Endian: {endian}")
         lines.append("")
-        for i, r in enumerate(regs):
-            addr = start_addr + i
-            hexv = f"0x{r:04X}"
-            unsigned = r
-            signed = r if r < 0x8000 else r - 0x10000
-            try:
-                b = r.to_bytes(2, byteorder="big", signed=False)
-                bb = b[::-1] if endian == "little" else b
-                f16 = from_bytes_to_float16(bb)
-                f16s = f"{f16:.6g}" if f16 is not None else "—"
-            except Exception:
-                f16s = "—"
-            lines.append(f"[{i}] addr={addr}  hex={hexv}  u={unsigned}  s={signed}  f16={f16s}")
+        # Byte order is fixed for the whole list, so pick it once; signed
+        # values for every register come from a single struct round trip
+        little = endian == "little"
+        signed_values = struct.unpack(f">{len(regs)}h", _pack_be_words(regs))
+        for i, (r, signed) in enumerate(zip(regs, signed_values)):
+            f16s = _format_half(_swap16(r) if little else r)
+            lines.append(f"[{i}] addr={start_addr + i}  hex=0x{r:04X}  u={r}  s={signed}  f16={f16s}")
 
         # show combined 32-bit interpretations for adjacent pairs
         if len(regs) >= 2:
             lines.append("")
             lines.append("32-bit pairs:")
-            for i in range(0, len(regs) - 1, 2):
-                a = regs[i]
-                b = regs[i + 1]
-                bv = a.to_bytes(2, byteorder='big') + b.to_bytes(2, byteorder='big')
-                if endian == 'big':
-                    raw_be = bv
-                elif endian == 'little':
-                    raw_be = bv[::-1]
-                elif endian == 'mid-big':
-                    raw_be = bytes([bv[2], bv[3], bv[0], bv[1]])
-                else:
-                    raw_be = bytes([bv[1], bv[0], bv[3], bv[2]])
-                try:
-                    i32 = int.from_bytes(raw_be, byteorder='big', signed=True)
-                except Exception:
-                    i32 = 0
-                try:
-                    f32 = struct.unpack('!f', raw_be)[0]
-                    f32s = f"{f32:.6g}"
-                except Exception:
-                    f32s = '—'
-                lines.append(f"pair[{i}//{i+1}] i32={i32}  f32={f32s}  raw=0x{raw_be.hex().upper()}")
+            raw, i32s, f32s = unpack_register_pairs(regs, endian)
+            raw_hex = raw.hex().upper()
+            for n, (i32, f32) in enumerate(zip(i32s, f32s)):
+                i = n * 2
+                lines.append(f"pair[{i}//{i+1}] i32={i32}  f32={f32:.6g}  raw=0x{raw_hex[n * 8:n * 8 + 8]}")
 
         return "\n".join(lines)
 
@@ -2093,7 +2472,7 @@ class MainWindow(QMainWindow):
         """
         if uri is None:
             uri = self._connection_uri or self.build_uri()
-        return await asyncio.to_thread(
+        return await _run_io(
             run_gui_read,
             uri,
             addr,
@@ -2105,6 +2484,31 @@ class MainWindow(QMainWindow):
             unit,
         )
 
+    async def _read_values(
+        self,
+        addr: int,
+        value_count: int,
+        long_mode: bool,
+        data_type: DataType,
+        unit: int,
+        uri: Optional[str] = None,
+    ) -> List[Union[int, bool]]:
+        """Read raw register/bit values without building table rows.
+        
+        Raises RuntimeError with user-friendly message on errors.
+        """
+        if uri is None:
+            uri = self._connection_uri or self.build_uri()
+        return await _run_io(
+            run_gui_read_raw,
+            uri,
+            addr,
+            value_count,
+            long_mode,
+            data_type,
+            unit,
+        )
+
     async def _write_registers(self, uri: str, addr: int, unit: int, values: List[int], data_type: DataType, long_mode: bool, endian: str, float_mode: bool, signed: bool) -> bool:
         """Write values using standalone blocking client.
         
@@ -2117,7 +2521,7 @@ class MainWindow(QMainWindow):
             # For multi-register, use first value (caller should have encoded properly)
             value_text = str(values[0] if values else 0)
         
-        ok, _ = await asyncio.to_thread(run_gui_write, uri, addr, long_mode, endian, float_mode, signed, value_text, data_type, unit)
+        ok, _ = await _run_io(run_gui_write, uri, addr, long_mode, endian, float_mode, signed, value_text, data_type, unit)
         return ok
 
 
@@ -2136,7 +2540,29 @@ class MainWindow(QMainWindow):
         result = decode_registers(regs, long_mode=is_32bit, include_all_formats=True)
         return decode_to_table_dict(result)
 
+    def _on_tab_changed(self, index: int) -> None:
+        widget = self.tabs.widget(index)
+        build = self._pending_tab_builders.pop(widget, None)
+        if build is not None:
+            build()
+        if widget is self.interact_tab:
+            self.on_read_selection_changed()
+        elif widget is self.monitor_tab:
+            self.on_monitor_selection_changed()
+            self._monitor_shown.set()
+
+    def changeEvent(self, event):
+        # Wake a paused monitor as soon as the window is restored
+        if event.type() == QEvent.WindowStateChange and self._monitor_is_visible():
+            self._monitor_shown.set()
+        super().changeEvent(event)
+
+    def _monitor_is_visible(self) -> bool:
+        return self.isVisible() and not self.isMinimized() and self.tabs.currentWidget() is self.monitor_tab
+
     def on_read_selection_changed(self, selected=None, deselected=None):
+        if not self.read_details_table.isVisible():
+            return
         try:
             sel = self.read_table.selectionModel().selectedRows()
             if not sel:
@@ -2151,15 +2577,19 @@ class MainWindow(QMainWindow):
                 if hexstr and hexstr.startswith('0x'):
                     hb = bytes.fromhex(hexstr[2:])
                     if len(hb) == 2:
-                        regs = [int.from_bytes(hb, byteorder='big')]
+                        regs = [_U16_BE.unpack(hb)[0]]
                     elif len(hb) == 4:
-                        regs = [int.from_bytes(hb[0:2], byteorder='big'), int.from_bytes(hb[2:4], byteorder='big')]
+                        regs = list(_U16U16_BE.unpack(hb))
                     else:
                         regs = [row.int_value & 0xFFFF]
                 else:
                     regs = [row.int_value & 0xFFFF]
             except Exception:
                 regs = [row.int_value & 0xFFFF]
+            key = tuple(regs)
+            if key == self._read_details_regs:
+                return
+            self._read_details_regs = key
 
             try:
                 decoding_rows = self._compute_decoding_rows(regs)
@@ -2167,15 +2597,13 @@ class MainWindow(QMainWindow):
                 # If decoding failed, fall back to Big/Little basic numeric view
                 logger.exception("Decoding helper failed for regs=%s", regs)
                 decoding_rows = []
-                for label, order in [('Big', 'big'), ('Little', 'little')]:
+                for label, order in _FALLBACK_DETAIL_ORDERS:
                     try:
-                        b = regs[0].to_bytes(2, byteorder='big')
-                        bb = b if order == 'big' else b[::-1]
-                        hexs = bb.hex().upper()
-                        u = int.from_bytes(bb, byteorder='big', signed=False)
-                        s = u if u < 0x8000 else u - 0x10000
+                        u = regs[0] if order == 'big' else _swap16(regs[0])
+                        hexs = f"{u:04X}"
+                        s = u - ((u & 0x8000) << 1)
                         try:
-                            f16 = from_bytes_to_float16(bb)
+                            f16 = from_bytes_to_float16(_U16_BE.pack(u))
                             f16s = '' if f16 is None else f"{f16:.6g}"
                         except Exception:
                             f16s = ''
@@ -2185,48 +2613,19 @@ class MainWindow(QMainWindow):
                         s = ''
                         f16s = ''
                     decoding_rows.append({'Format': label, 'Hex': hexs, 'UInt16': str(u), 'Int16': str(s), 'Float16': f16s})
-            # Populate read_details_table
-            table = self.read_details_table
             # Show only the appropriate set of columns depending on register width.
             # For 32-bit longs we hide the 16-bit columns (1-4) and show 32-bit columns (5-8).
             is_32 = len(regs) >= 2
-            if is_32:
-                # Hide 16-bit columns and show 32-bit columns
-                table.setColumnHidden(1, True)
-                table.setColumnHidden(2, True)
-                table.setColumnHidden(3, True)
-                table.setColumnHidden(4, True)
-                table.setColumnHidden(5, False)
-                table.setColumnHidden(6, False)
-                table.setColumnHidden(7, False)
-                table.setColumnHidden(8, False)
-            else:
-                # Show 16-bit columns and hide 32-bit columns
-                table.setColumnHidden(1, False)
-                table.setColumnHidden(2, False)
-                table.setColumnHidden(3, False)
-                table.setColumnHidden(4, False)
-                table.setColumnHidden(5, True)
-                table.setColumnHidden(6, True)
-                table.setColumnHidden(7, True)
-                table.setColumnHidden(8, True)
-
-            # Populate rows from decoding_rows
-            table.setRowCount(len(decoding_rows))
-            for r_idx, d in enumerate(decoding_rows):
-                table.setItem(r_idx, 0, QTableWidgetItem(d.get('Format', '')))
-                table.setItem(r_idx, 1, QTableWidgetItem(d.get('Hex', '')))
-                table.setItem(r_idx, 2, QTableWidgetItem(d.get('UInt16', '')))
-                table.setItem(r_idx, 3, QTableWidgetItem(d.get('Int16', '')))
-                table.setItem(r_idx, 4, QTableWidgetItem(d.get('Float16', '')))
-                table.setItem(r_idx, 5, QTableWidgetItem(d.get('Hex32', '')))
-                table.setItem(r_idx, 6, QTableWidgetItem(d.get('UInt32', '')))
-                table.setItem(r_idx, 7, QTableWidgetItem(d.get('Int32', '')))
-                table.setItem(r_idx, 8, QTableWidgetItem(d.get('Float32', '')))
+            if self._read_details_is_32 != is_32:
+                _show_width_columns(self.read_details_table, is_32)
+                self._read_details_is_32 = is_32
+            self.read_details_model.set_rows(decoding_rows)
         except Exception:
             pass
 
     def on_monitor_selection_changed(self, selected=None, deselected=None):
+        if not self.monitor_details_table.isVisible():
+            return
         try:
             indexes = self.monitor_table.selectionModel().selectedIndexes()
             if not indexes:
@@ -2234,7 +2633,7 @@ class MainWindow(QMainWindow):
             idx = indexes[0]
             row = idx.row()
             col = idx.column()
-            sample = list(self.monitor_model._samples)[row]
+            sample = self.monitor_model.sample_at(row)
 
             # Choose which register(s) to decode based on selection
             regs: List[int] = []
@@ -2256,42 +2655,14 @@ class MainWindow(QMainWindow):
                 regs = [int(sample.raw_registers[reg_idx]) & 0xFFFF]
 
             rows = self._compute_decoding_rows(regs)
-            table = self.monitor_details_table
             is_32 = len(regs) >= 2
-            if is_32:
-                table.setColumnHidden(1, True)
-                table.setColumnHidden(2, True)
-                table.setColumnHidden(3, True)
-                table.setColumnHidden(4, True)
-                table.setColumnHidden(5, False)
-                table.setColumnHidden(6, False)
-                table.setColumnHidden(7, False)
-                table.setColumnHidden(8, False)
-            else:
-                table.setColumnHidden(1, False)
-                table.setColumnHidden(2, False)
-                table.setColumnHidden(3, False)
-                table.setColumnHidden(4, False)
-                table.setColumnHidden(5, True)
-                table.setColumnHidden(6, True)
-                table.setColumnHidden(7, True)
-                table.setColumnHidden(8, True)
-            table.setRowCount(len(rows))
-            for r_idx, d in enumerate(rows):
-                table.setItem(r_idx, 0, QTableWidgetItem(d['Format']))
-                table.setItem(r_idx, 1, QTableWidgetItem(d.get('Hex', '')))
-                table.setItem(r_idx, 2, QTableWidgetItem(d.get('UInt16', '')))
-                table.setItem(r_idx, 3, QTableWidgetItem(d.get('Int16', '')))
-                table.setItem(r_idx, 4, QTableWidgetItem(d.get('Float16', '')))
-                table.setItem(r_idx, 5, QTableWidgetItem(d.get('Hex32', '')))
-                table.setItem(r_idx, 6, QTableWidgetItem(d.get('UInt32', '')))
-                table.setItem(r_idx, 7, QTableWidgetItem(d.get('Int32', '')))
-                table.setItem(r_idx, 8, QTableWidgetItem(d.get('Float32', '')))
+            if self._monitor_details_is_32 != is_32:
+                _show_width_columns(self.monitor_details_table, is_32)
+                self._monitor_details_is_32 = is_32
             if sample.error:
                 # Prepend an error row if present
-                table.insertRow(0)
-                table.setItem(0, 0, QTableWidgetItem("ERROR"))
-                table.setItem(0, 1, QTableWidgetItem(sample.error))
+                rows.insert(0, {'Format': "ERROR", 'Hex': sample.error})
+            self.monitor_details_model.set_rows(rows)
         except Exception:
             pass
 
@@ -2324,22 +2695,22 @@ class MainWindow(QMainWindow):
         interval_ms = self.monitor_interval_spin.value()
         interval_sec = interval_ms / 1000.0
 
-        unit = self._parse_int(self.unit_edit.text()) or 1
+        unit = self._current_unit()
         # Configure the model with displayed column count
         data_type = self._current_data_type()
         # Determine whether the monitoring config changed (address/count/long_mode)
-        prev_start = getattr(self.monitor_model, '_start_addr', None)
-        prev_count = getattr(self.monitor_model, '_value_count', None)
-        prev_long = getattr(self.monitor_model, '_long_mode', None)
+        prev_start = self.monitor_model._start_addr
+        prev_count = self.monitor_model._value_count
+        prev_long = self.monitor_model._long_mode
         config_changed = (prev_start != addr) or (prev_count != count) or (prev_long != long_mode)
 
         self.monitor_model.set_config(count, long_mode, e_norm, data_type, start_addr=addr)
         # Clear old samples only when config changed (start addr, count or long toggle)
         if config_changed:
+            self._monitor_pending_samples = []
             self.monitor_model.clear_samples()
             try:
-                self.monitor_details_table.clearContents()
-                self.monitor_details_table.setRowCount(0)
+                self.monitor_details_model.clear()
             except Exception:
                 pass
 
@@ -2349,6 +2720,7 @@ class MainWindow(QMainWindow):
         self.monitor_status_label.setText(f"Monitoring address {addr} every {interval_ms}ms...")
 
         # Start the polling task
+        self._monitor_stop = asyncio.Event()
         self._monitor_task = asyncio.create_task(
             self._monitor_polling_loop(addr, count, long_mode, e_norm, unit, interval_sec, data_type)
         )
@@ -2357,7 +2729,9 @@ class MainWindow(QMainWindow):
     async def on_monitor_stop_clicked(self):
         """Stop the monitor polling task."""
         if self._monitor_task and not self._monitor_task.done():
-            self._monitor_task.cancel()
+            # Let the loop finish its current poll and leave on its own
+            self._monitor_stop.set()
+            self._monitor_shown.set()
             try:
                 await self._monitor_task
             except asyncio.CancelledError:
@@ -2372,90 +2746,150 @@ class MainWindow(QMainWindow):
     @qasync.asyncSlot()
     async def on_monitor_clear_clicked(self):
         """Clear all monitor samples from the table."""
+        self._monitor_pending_samples = []
         self.monitor_model.clear_samples()
         self.monitor_status_label.setText("Cleared")
 
+    def _queue_monitor_sample(self, sample: MonitorSample):
+        """Buffer a polled sample; the table is updated once per frame."""
+        self._monitor_pending_samples.append(sample)
+        if self._monitor_flush_scheduled:
+            return
+        self._monitor_flush_scheduled = True
+        QTimer.singleShot(16, self._flush_monitor_samples)
+
+    def _flush_monitor_samples(self):
+        self._monitor_flush_scheduled = False
+        batch, self._monitor_pending_samples = self._monitor_pending_samples, []
+        if not batch:
+            return
+        self.monitor_model.add_samples(batch)
+        try:
+            if self._monitor_stick_to_bottom:
+                self.monitor_table.scrollToBottom()
+            # Only drop stale details when the user isn't inspecting a row,
+            # and skip the model reset when the pane is already empty
+            if self.monitor_details_model.rowCount() and not self.monitor_table.selectionModel().hasSelection():
+                self.monitor_details_model.clear()
+        except Exception:
+            pass
+
     async def _monitor_polling_loop(self, addr: int, count: int, long_mode: bool, endian: str, unit: int, interval_sec: float, data_type: DataType):
         """Async polling loop that reads from the device at configured interval."""
         poll_count = 0
-        while True:
-            try:
-                poll_count += 1
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-
-                # Attempt to read registers using standalone blocking client
+        # Resolve the connection once per monitor session rather than per poll
+        uri = self._connection_uri or self.build_uri()
+        # Raw values per poll: registers (doubled in long mode) or bits
+        total = max(1, count) * (2 if long_mode and is_register_type(data_type) else 1)
+        # Polls are anchored to a fixed schedule so read latency doesn't add
+        # up; if a poll overruns, missed ticks are skipped rather than stacked
+        next_deadline = time.monotonic()
+        stop = self._monitor_stop
+        # Hold the connection open between polls, even past the idle TTL
+        with _pinned_gui_client(uri):
+            while not stop.is_set():
+                if not self._monitor_is_visible():
+                    # No Modbus traffic while minimized or on another tab
+                    self.monitor_status_label.setText(f"Paused while hidden (poll #{poll_count})")
+                    self._monitor_shown.clear()
+                    await self._monitor_shown.wait()
+                    if stop.is_set():
+                        break
+                    next_deadline = time.monotonic()
                 try:
-                    rows = await self._read_rows(
-                        addr,
-                        count,
-                        long_mode,
-                        endian,
-                        False,
-                        data_type,
-                        unit,
-                        self._connection_uri,
-                    )
-                    regs = [int(r.int_value or 0) & 0xFFFF for r in rows] if rows else []
-
-                    # Create one sample with all raw register values for this interval
-                    sample = MonitorSample(
-                        timestamp=timestamp,
-                        raw_registers=list(regs),
-                        address_start=addr,
-                        unit_id=unit,
-                        data_type=data_type,
-                    )
-                    self.monitor_model.add_sample(sample)
+                    poll_count += 1
+                    timestamp = format_clock_ms(time.time())
 
-                    # Auto-scroll to bottom (newest entry)
+                    # Attempt to read registers using standalone blocking client
                     try:
-                        self.monitor_table.scrollToBottom()
-                    except Exception:
-                        pass
-
-                    # Update status
-                    self.monitor_status_label.setText(f"Monitoring (poll #{poll_count})")
-                    # clear monitor details for new sample selection
-                    try:
-                        self.monitor_details.clear()
-                    except Exception:
-                        pass
-
-                except RuntimeError as exc:
-                    # RuntimeError from run_gui_read contains user-friendly message
-                    logger.warning("Monitor poll error: %s", exc)
-                    error_sample = MonitorSample(
-                        timestamp=timestamp,
-                        raw_registers=[],
-                        address_start=addr,
-                        unit_id=unit,
-                        data_type=data_type,
-                        error=str(exc),
-                    )
-                    self.monitor_model.add_sample(error_sample)
+                        values = await self._read_values(addr, count, long_mode, data_type, unit, uri)
+                        try:
+                            # Registers (and bits, as 0/1) fill the array in one C call
+                            regs = array("H", values[:total])
+                        except (OverflowError, TypeError):
+                            regs = array("H", [int(v) & 0xFFFF for v in values[:total]])
+
+                        # Create one sample with all raw register values for this interval
+                        sample = MonitorSample(
+                            timestamp=timestamp,
+                            raw_registers=regs,
+                            address_start=addr,
+                            unit_id=unit,
+                            data_type=data_type,
+                        )
+                        # Added and auto-scrolled to on the next frame
+                        self._queue_monitor_sample(sample)
+
+                        # Update status
+                        self.monitor_status_label.setText(f"Monitoring (poll #{poll_count})")
+
+                    except RuntimeError as exc:
+                        # RuntimeError from run_gui_read contains user-friendly message
+                        logger.warning("Monitor poll error: %s", exc)
+                        error_sample = MonitorSample(
+                            timestamp=timestamp,
+                            raw_registers=[],
+                            address_start=addr,
+                            unit_id=unit,
+                            data_type=data_type,
+                            error=str(exc),
+                        )
+                        self._queue_monitor_sample(error_sample)
+                    except Exception as exc:
+                        # Unexpected error - log full traceback but continue monitoring
+                        logger.exception("Monitor poll unexpected error")
+                        error_sample = MonitorSample(
+                            timestamp=timestamp,
+                            raw_registers=[],
+                            address_start=addr,
+                            unit_id=unit,
+                            data_type=data_type,
+                            error=f"Unexpected error: {exc}",
+                        )
+                        self._queue_monitor_sample(error_sample)
+
+                except asyncio.CancelledError:
+                    # Task cancelled, exit loop cleanly
+                    raise
                 except Exception as exc:
-                    # Unexpected error - log full traceback but continue monitoring
-                    logger.exception("Monitor poll unexpected error")
-                    error_sample = MonitorSample(
-                        timestamp=timestamp,
-                        raw_registers=[],
-                        address_start=addr,
-                        unit_id=unit,
-                        data_type=data_type,
-                        error=f"Unexpected error: {exc}",
-                    )
-                    self.monitor_model.add_sample(error_sample)
+                    logger.exception("Unexpected error in monitor polling loop")
+                    # Continue polling despite errors
 
                 # Wait for next poll interval
-                await asyncio.sleep(interval_sec)
+                next_deadline += interval_sec
+                delay = next_deadline - time.monotonic()
+                if delay < 0:
+                    skipped = int(-delay // interval_sec) + 1
+                    logger.debug("Monitor poll overran by %.0f ms; skipping %d tick(s)", -delay * 1000, skipped)
+                    next_deadline += skipped * interval_sec
+                    delay = next_deadline - time.monotonic()
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+
+def _run_event_loop(app: QApplication) -> None:
+    """Run asyncio on the Qt event loop until the application quits.
+
+    Uses the qasync bridge. Set UMDT_ASYNC_LOOP=qtasyncio to try PySide6's
+    QtAsyncio (6.6+) instead; the GUI's slots, executors and events have
+    not been verified on it yet.
+    """
+    if os.environ.get("UMDT_ASYNC_LOOP", "").strip().lower() == "qtasyncio":
+        try:
+            from PySide6 import QtAsyncio
+        except ImportError:
+            QtAsyncio = None
+        if QtAsyncio is not None:
+            QtAsyncio.run()
+            return
+
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    with loop:
+        loop.run_forever()
 
-            except asyncio.CancelledError:
-                # Task cancelled, exit loop cleanly
-                raise
-            except Exception as exc:
-                logger.exception("Unexpected error in monitor polling loop")
-                # Continue polling despite errors
-                await asyncio.sleep(interval_sec)
 
 def main():
     app = QApplication(sys.argv)
@@ -2466,9 +2900,6 @@ def main():
         except Exception:
             pass
 
-    loop = qasync.QEventLoop(app)
-    asyncio.set_event_loop(loop)
-
     window = MainWindow()
     if os.path.exists(ICON_PATH):
         try:
@@ -2477,8 +2908,9 @@ def main():
             pass
     window.show()
 
-    with loop:
-        loop.run_forever()
+    _run_event_loop(app)
+    _IO_EXECUTOR.shutdown(wait=False)
+    close_gui_clients()
 
 if __name__ == "__main__":
     main()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import math
+import shlex
 from pathlib import Path
 from typing import List, Optional
 
@@ -11,12 +13,24 @@ from rich.table import Table
 
 from umdt.core.data_types import DataType, parse_data_type
 from umdt.mock_server import MockDevice, TransportCoordinator, load_config
+from umdt.mock_server.config import dump_yaml, load_yaml
 
 try:
     import yaml  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     yaml = None
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    from prompt_toolkit import PromptSession  # type: ignore
+    from prompt_toolkit.patch_stdout import patch_stdout  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    PromptSession = None
+
 app = typer.Typer(help="Diagnostics mock Modbus server CLI")
 groups_app = typer.Typer(help="Manage register groups in config files")
 values_app = typer.Typer(help="Manage register-level rules")
@@ -26,7 +40,6 @@ app.add_typer(values_app, name="values")
 app.add_typer(faults_app, name="faults")
 console = Console()
 
-
 def _ensure_transport_args(tcp_host: Optional[str], tcp_port: Optional[int], serial_port: Optional[str]) -> None:
     tcp = tcp_host or tcp_port
     if tcp and serial_port:
@@ -41,7 +54,7 @@ def _load_config_dict(path: Path) -> tuple[dict, str]:
     if fmt == "yaml":
         if yaml is None:
             raise typer.BadParameter("PyYAML is required for YAML configs")
-        data = yaml.safe_load(text) or {}
+        data = load_yaml(text) or {}
     else:
         data = json.loads(text or "{}")
     if not isinstance(data, dict):
@@ -49,13 +62,34 @@ def _load_config_dict(path: Path) -> tuple[dict, str]:
     return data, fmt
 
 
+def _has_non_finite(value) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def _dump_json(data: dict) -> str:
+    # json.dumps drops to its pure-Python encoder whenever indent is set.
+    # orjson writes NaN/Infinity as null, so those configs stay on json.
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE).decode("utf-8")
+        except TypeError:
+            pass  # non-str keys or ints wider than 64 bits; let json handle them
+    return json.dumps(data, indent=2)
+
+
 def _write_config_dict(path: Path, data: dict, fmt: str) -> None:
     if fmt == "yaml":
         if yaml is None:
             raise typer.BadParameter("PyYAML is required for YAML configs")
-        text = yaml.safe_dump(data, sort_keys=False)
+        text = dump_yaml(data)
     else:
-        text = json.dumps(data, indent=2)
+        text = _dump_json(data)
     if not text.endswith("\n"):
         text += "\n"
     path.write_text(text, encoding="utf-8")
@@ -63,9 +97,17 @@ def _write_config_dict(path: Path, data: dict, fmt: str) -> None:
 
 async def _interactive_console(device: MockDevice) -> None:
     console.print("[bold cyan]Interactive console ready[/] — commands: help, groups, set, rule, fault, events, snapshot, quit")
+    # prompt_toolkit reads on the event loop, so the prompt is cancellable and
+    # no worker thread is left blocked in input() at shutdown
+    session = PromptSession() if PromptSession is not None else None
     while True:
         try:
-            raw = await asyncio.to_thread(input, "mock-server> ")
+            if session is not None:
+                # Keep event printer output above the prompt line
+                with patch_stdout():
+                    raw = await session.prompt_async("mock-server> ")
+            else:
+                raw = await asyncio.to_thread(input, "mock-server> ")
         except (EOFError, KeyboardInterrupt):
             console.print("Exiting console...")
             return
@@ -247,6 +289,46 @@ def status(config: Path = typer.Option(..., exists=True, readable=True, help="Co
     console.print(table)
 
 
+@app.command()
+def batch(
+    config: Path = typer.Option(..., exists=True, help="Config file to edit"),
+    script: Path = typer.Option(..., exists=True, readable=True, help="File with one groups/values/faults command per line"),
+):
+    """Apply a script of config edits, parsing and writing the config once.
+
+    Each line is a `groups add/remove`, `values set/clear` or
+    `faults inject` command as it would be given on the command line,
+    without `--config` (e.g. `groups add pumps --start 0 --length 8`).
+    Blank lines and `#` comments are skipped. Nothing is written unless
+    every line succeeds.
+    """
+
+    command = typer.main.get_command(app)
+    cfg, fmt = _load_config_dict(config)
+    applied = 0
+    for lineno, line in enumerate(script.read_text(encoding="utf-8").splitlines(), 1):
+        args = shlex.split(line, comments=True)
+        if not args:
+            continue
+        apply = _BATCH_EDITS.get(tuple(args[:2]))
+        if apply is None:
+            raise typer.BadParameter(f"{script}:{lineno}: '{' '.join(args[:2])}' cannot be batched")
+        try:
+            # Parse with the subcommand's own options, then edit cfg in place
+            subcommand = command.commands[args[0]].commands[args[1]]
+            params = subcommand.make_context(args[1], [*args[2:], "--config", str(config)]).params
+            params.pop("config", None)
+            apply(cfg, **params)
+        except Exception as exc:
+            message = exc.format_message() if hasattr(exc, "format_message") else str(exc)
+            console.print(f"[red]{script}:{lineno}: {message}; {config} left unchanged[/]")
+            raise typer.Exit(1) from exc
+        applied += 1
+    if applied:
+        _write_config_dict(config, cfg, fmt)
+    console.print(f"Applied {applied} command(s) to {config}")
+
+
 @groups_app.command("list")
 def groups_list(config: Path = typer.Option(..., exists=True, readable=True)):
     """List register groups defined in the config."""
@@ -270,19 +352,14 @@ def groups_list(config: Path = typer.Option(..., exists=True, readable=True)):
     console.print(table)
 
 
-@groups_app.command("add")
-def groups_add(
-    config: Path = typer.Option(..., exists=True),
-    name: str = typer.Argument(..., help="Friendly group name"),
-    data_type: str = typer.Option("holding", help="Data type: holding/input/coil/discrete"),
-    start: int = typer.Option(..., help="Starting address"),
-    length: int = typer.Option(..., help="Number of addresses"),
-    writable: bool = typer.Option(True, help="Allow writes"),
-    description: str = typer.Option("", help="Optional description"),
-):
-    """Append a register group to the config file."""
+# Config edits shared by the subcommands below and `batch`. Each one changes
+# cfg in place and returns the message to print; LookupError means there was
+# nothing to change.
 
-    cfg, fmt = _load_config_dict(config)
+
+def _apply_groups_add(
+    cfg: dict, name: str, data_type: str, start: int, length: int, writable: bool, description: str
+) -> str:
     try:
         dtype = parse_data_type(data_type).value
     except ValueError as exc:
@@ -300,8 +377,78 @@ def groups_add(
             "description": description,
         }
     )
+    return f"Added group '{name}'"
+
+
+def _apply_groups_remove(cfg: dict, name: str) -> str:
+    groups = cfg.get("groups", []) or []
+    if not isinstance(groups, list):
+        raise typer.BadParameter("'groups' must be a list")
+    new_groups = [g for g in groups if g.get("name") != name]
+    if len(new_groups) == len(groups):
+        raise LookupError(f"No group named '{name}' was found.")
+    cfg["groups"] = new_groups
+    return f"Removed group '{name}'"
+
+
+def _apply_values_set(cfg: dict, address: int, value: int, mode: str, exception_code: Optional[int]) -> str:
+    rules = cfg.setdefault("rules", {})
+    if not isinstance(rules, dict):
+        raise typer.BadParameter("'rules' must be a mapping")
+    rule: dict = {"mode": mode}
+    if mode == "frozen-value":
+        rule["forced_value"] = value
+    if mode == "exception":
+        rule["exception_code"] = exception_code or 2
+    if mode == "ignore-write":
+        rule["ignore_write"] = True
+    rules[str(address)] = rule
+    return f"Rule {mode} applied to address {address}"
+
+
+def _apply_values_clear(cfg: dict, address: int) -> str:
+    rules = cfg.get("rules", {})
+    if not isinstance(rules, dict):
+        raise LookupError("No rules defined")
+    if str(address) not in rules:
+        raise LookupError(f"No rule set for address {address}")
+    del rules[str(address)]
+    return f"Cleared rule for address {address}"
+
+
+def _apply_faults_inject(cfg: dict, field: str, value: float) -> str:
+    faults = cfg.setdefault("faults", {})
+    if not isinstance(faults, dict):
+        raise typer.BadParameter("'faults' must be an object")
+    faults[field] = value
+    return f"Fault '{field}' set to {value}"
+
+
+_BATCH_EDITS = {
+    ("groups", "add"): _apply_groups_add,
+    ("groups", "remove"): _apply_groups_remove,
+    ("values", "set"): _apply_values_set,
+    ("values", "clear"): _apply_values_clear,
+    ("faults", "inject"): _apply_faults_inject,
+}
+
+
+@groups_app.command("add")
+def groups_add(
+    config: Path = typer.Option(..., exists=True),
+    name: str = typer.Argument(..., help="Friendly group name"),
+    data_type: str = typer.Option("holding", help="Data type: holding/input/coil/discrete"),
+    start: int = typer.Option(..., help="Starting address"),
+    length: int = typer.Option(..., help="Number of addresses"),
+    writable: bool = typer.Option(True, help="Allow writes"),
+    description: str = typer.Option("", help="Optional description"),
+):
+    """Append a register group to the config file."""
+
+    cfg, fmt = _load_config_dict(config)
+    message = _apply_groups_add(cfg, name, data_type, start, length, writable, description)
     _write_config_dict(config, cfg, fmt)
-    console.print(f"Added group '{name}' to {config}")
+    console.print(f"{message} to {config}")
 
 
 @groups_app.command("remove")
@@ -312,16 +459,13 @@ def groups_remove(
     """Remove a register group by name."""
 
     cfg, fmt = _load_config_dict(config)
-    groups = cfg.get("groups", []) or []
-    if not isinstance(groups, list):
-        raise typer.BadParameter("'groups' must be a list")
-    new_groups = [g for g in groups if g.get("name") != name]
-    if len(new_groups) == len(groups):
-        console.print(f"No group named '{name}' was found.")
+    try:
+        message = _apply_groups_remove(cfg, name)
+    except LookupError as exc:
+        console.print(str(exc))
         return
-    cfg["groups"] = new_groups
     _write_config_dict(config, cfg, fmt)
-    console.print(f"Removed group '{name}'")
+    console.print(message)
 
 
 @groups_app.command("reset")
@@ -350,19 +494,9 @@ def values_set(
     """Apply a register rule (e.g., frozen value or exception) at the config level."""
 
     cfg, fmt = _load_config_dict(config)
-    rules = cfg.setdefault("rules", {})
-    if not isinstance(rules, dict):
-        raise typer.BadParameter("'rules' must be a mapping")
-    rule: dict = {"mode": mode}
-    if mode == "frozen-value":
-        rule["forced_value"] = value
-    if mode == "exception":
-        rule["exception_code"] = exception_code or 2
-    if mode == "ignore-write":
-        rule["ignore_write"] = True
-    rules[str(address)] = rule
+    message = _apply_values_set(cfg, address, value, mode, exception_code)
     _write_config_dict(config, cfg, fmt)
-    console.print(f"Rule {mode} applied to address {address}")
+    console.print(message)
 
 
 @values_app.command("clear")
@@ -373,16 +507,13 @@ def values_clear(
     """Remove a rule for the specified address."""
 
     cfg, fmt = _load_config_dict(config)
-    rules = cfg.get("rules", {})
-    if not isinstance(rules, dict):
-        console.print("No rules defined")
+    try:
+        message = _apply_values_clear(cfg, address)
+    except LookupError as exc:
+        console.print(str(exc))
         return
-    if str(address) in rules:
-        del rules[str(address)]
-        _write_config_dict(config, cfg, fmt)
-        console.print(f"Cleared rule for address {address}")
-    else:
-        console.print(f"No rule set for address {address}")
+    _write_config_dict(config, cfg, fmt)
+    console.print(message)
 
 
 @faults_app.command("inject")
@@ -394,12 +525,9 @@ def faults_inject(
     """Update the default fault profile entry in the config file."""
 
     cfg, fmt = _load_config_dict(config)
-    faults = cfg.setdefault("faults", {})
-    if not isinstance(faults, dict):
-        raise typer.BadParameter("'faults' must be an object")
-    faults[field] = value
+    message = _apply_faults_inject(cfg, field, value)
     _write_config_dict(config, cfg, fmt)
-    console.print(f"Fault '{field}' set to {value}")
+    console.print(message)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from pathlib import Path
 import sys
 from typing import Optional
@@ -11,7 +12,7 @@ import qasync
 from umdt.core.data_types import DataType
 from umdt.mock_server import MockDevice, TransportCoordinator, load_config
 from umdt.mock_server.models import RegisterRule, ResponseMode, RegisterGroup
-from umdt.mock_server.config import MockServerConfig, TransportConfig
+from umdt.mock_server.config import MockServerConfig, TransportConfig, dump_yaml
 try:
     import yaml  # type: ignore
 except Exception:
@@ -59,6 +60,48 @@ class GroupTableModel(QtCore.QAbstractTableModel):
         return super().headerData(section, orientation, role)
 
 
+class EventLogModel(QtCore.QAbstractListModel):
+    """Bounded event log; the oldest lines drop off once ``capacity`` is reached."""
+
+    def __init__(self, capacity: int = 5000) -> None:
+        super().__init__()
+        self._lines: deque[str] = deque(maxlen=capacity)
+
+    def append_lines(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        capacity = self._lines.maxlen or len(lines)
+        if len(lines) >= capacity:
+            self.beginResetModel()
+            self._lines.clear()
+            self._lines.extend(lines[-capacity:])
+            self.endResetModel()
+            return
+        overflow = len(self._lines) + len(lines) - capacity
+        if overflow > 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._lines.popleft()
+            self.endRemoveRows()
+        first = len(self._lines)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(lines) - 1)
+        self._lines.extend(lines)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._lines.clear()
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._lines)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._lines[index.row()]
+
+
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -81,6 +124,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.device: Optional[MockDevice] = None
         self.coordinator: Optional[TransportCoordinator] = None
         self._event_task: Optional[asyncio.Task] = None
+        # Event lines are buffered and flushed to the view at most every 50 ms
+        self._event_pending: list[str] = []
+        self._event_flush_scheduled = False
 
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
@@ -339,14 +385,37 @@ class MainWindow(QtWidgets.QMainWindow):
     def _build_event_panel(self) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(widget)
-        self.event_log = QtWidgets.QPlainTextEdit()
-        self.event_log.setReadOnly(True)
+        self.event_model = EventLogModel()
+        self.event_log = QtWidgets.QListView()
+        self.event_log.setModel(self.event_model)
+        self.event_log.setUniformItemSizes(True)
+        self.event_log.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.event_log.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         layout.addWidget(self.event_log)
         clear_btn = QtWidgets.QPushButton("Clear Events")
-        clear_btn.clicked.connect(self.event_log.clear)
+        clear_btn.clicked.connect(self._clear_events)
         layout.addWidget(clear_btn)
         return widget
 
+    def _log_event(self, text: str) -> None:
+        self._event_pending.append(text)
+        if not self._event_flush_scheduled:
+            self._event_flush_scheduled = True
+            QtCore.QTimer.singleShot(50, self._flush_events)
+
+    def _flush_events(self) -> None:
+        self._event_flush_scheduled = False
+        lines, self._event_pending = self._event_pending, []
+        bar = self.event_log.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum()
+        self.event_model.append_lines(lines)
+        if at_bottom:
+            self.event_log.scrollToBottom()
+
+    def _clear_events(self) -> None:
+        self._event_pending.clear()
+        self.event_model.clear()
+
     def _choose_config(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select config", filter="Config (*.json *.yaml *.yml)")
         if path:
@@ -389,12 +458,12 @@ class MainWindow(QtWidgets.QMainWindow):
                 if yaml is None:
                     QtWidgets.QMessageBox.critical(self, "Save failed", "PyYAML is required to save YAML configs")
                     return
-                p.write_text(yaml.safe_dump(cfg_obj, sort_keys=False), encoding="utf-8")
+                p.write_text(dump_yaml(cfg_obj), encoding="utf-8")
             else:
                 import json
 
                 p.write_text(json.dumps(cfg_obj, indent=2), encoding="utf-8")
-            self.event_log.appendPlainText(f"Saved config to {path}")
+            self._log_event(f"Saved config to {path}")
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "Save failed", str(exc))
 
@@ -454,9 +523,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 await self.coordinator.start_serial(port, baud)
                 label = f"Serial {port}:{baud}"
             self._event_task = asyncio.create_task(self._event_loop())
-            self.event_log.appendPlainText(f"Server started on {label}")
+            self._log_event(f"Server started on {label}")
             if pcap_path:
-                self.event_log.appendPlainText(f"PCAP logging enabled: {pcap_path}")
+                self._log_event(f"PCAP logging enabled: {pcap_path}")
             self.start_btn.setEnabled(False)
             self.stop_btn.setEnabled(True)
         except Exception as exc:  # pylint: disable=broad-except
@@ -478,7 +547,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.device = None
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
-        self.event_log.appendPlainText("Server stopped")
+        self._log_event("Server stopped")
 
     async def _event_loop(self) -> None:
         if not self.device:
@@ -486,7 +555,7 @@ class MainWindow(QtWidgets.QMainWindow):
         try:
             while True:
                 event = await self.device.diagnostics.next_event()
-                self.event_log.appendPlainText(f"[{event.timestamp.isoformat()}] {event.transport}: {event.description}")
+                self._log_event(f"[{event.timestamp.isoformat()}] {event.transport}: {event.description}")
         except asyncio.CancelledError:
             return
 
@@ -505,7 +574,7 @@ class MainWindow(QtWidgets.QMainWindow):
             bit_flip_pct=bitflip,
         )
         details = f"latency={latency}ms, jitter={jitter}%, drop={drop}%, bit_flip={bitflip}%"
-        self.event_log.appendPlainText(f"Updated fault profile: {details}")
+        self._log_event(f"Updated fault profile: {details}")
 
     async def _apply_rule(self) -> None:
         if not self.device:
@@ -520,7 +589,7 @@ class MainWindow(QtWidgets.QMainWindow):
         mode = self.mode_combo.currentText()
         if mode == "write":
             await self.device.write(dtype, address, [value])
-            self.event_log.appendPlainText(f"Wrote {value} to {dtype.value} {address}")
+            self._log_event(f"Wrote {value} to {dtype.value} {address}")
             return
         from umdt.mock_server.models import RegisterRule, ResponseMode
 
@@ -536,7 +605,7 @@ class MainWindow(QtWidgets.QMainWindow):
             detail += f", value={value}"
         elif mode == "exception":
             detail += f", exception_code={value}"
-        self.event_log.appendPlainText(f"Applied rule to {dtype.value} address {address}: {detail}")
+        self._log_event(f"Applied rule to {dtype.value} address {address}: {detail}")
 
 
 def main() -> None:
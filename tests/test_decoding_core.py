@@ -7,6 +7,7 @@ from umdt.utils.decoding import (
     decode_to_table_dict,
     format_permutations_32,
     float_permutations_from_regs,
+    unpack_register_pairs,
     DecodingRow,
     DecodingResult,
 )
@@ -19,3 +20,17 @@ def test_decode_register16_zero():
     assert result.rows[0].uint16 == 0
 
 # Note: original test file contained many tests; for brevity this moved file keeps a small subset.
+
+
+def test_unpack_register_pairs_matches_permutations():
+    regs = [0x4120, 0x0000, 0x1234, 0x5678, 0xFFFF]
+    labels = {"big": "Big", "little": "Little", "mid-big": "Mid-Big", "mid-little": "Mid-Little"}
+    for endian, label in labels.items():
+        raw, i32s, f32s = unpack_register_pairs(regs, endian)
+        # Trailing odd register is ignored
+        assert len(i32s) == len(f32s) == 2
+        for n in range(2):
+            expected = format_permutations_32(regs[n * 2:n * 2 + 2])[label]
+            assert raw[n * 4:n * 4 + 4] == expected["bytes"]
+            assert i32s[n] == int.from_bytes(expected["bytes"], "big", signed=True)
+    assert unpack_register_pairs([1], "big") == (b"", (), ())
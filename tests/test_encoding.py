@@ -116,6 +116,11 @@ class TestEncodeFloat16:
         result = encode_float16(float('-inf'))
         assert result == [0xFC00]
 
+    def test_overflow_saturates_to_infinity(self):
+        assert encode_float16(65504.0) == [0x7BFF]
+        assert encode_float16(1e6) == [0x7C00]
+        assert encode_float16(-70000) == [0xFC00]
+
     def test_nan(self):
         result = encode_float16(float('nan'))
         # NaN representation
@@ -4,6 +4,9 @@ import json
 from pathlib import Path
 
 import pytest
+from typer.testing import CliRunner
+
+import mock_server_cli
 
 from umdt.core.data_types import DataType
 from umdt.mock_server import MockDevice, load_config
@@ -47,6 +50,19 @@ def test_load_config_parses_groups_and_rules(tmp_path: Path) -> None:
     assert cfg.fault_profile["latency_ms"] == 10
 
 
+def test_load_config_reparses_after_edit(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "mock.json"
+    cfg_path.write_text(json.dumps({"unit_id": 1, "faults": {"latency_ms": 5}}), encoding="utf-8")
+
+    first = load_config(cfg_path)
+    first.fault_profile["latency_ms"] = 99
+    again = load_config(cfg_path)
+    assert again.fault_profile["latency_ms"] == 5
+
+    cfg_path.write_text(json.dumps({"unit_id": 12, "faults": {"latency_ms": 5}}), encoding="utf-8")
+    assert load_config(cfg_path).unit_id == 12
+
+
 @pytest.mark.asyncio
 async def test_mock_device_rules_and_scripts() -> None:
     cfg = MockServerConfig(
@@ -87,4 +103,77 @@ async def test_diagnostics_drop_request() -> None:
     )
     device = MockDevice(cfg)
     with pytest.raises(RequestDropped):
-        await device.read(DataType.COIL, 0, 1)
\ No newline at end of file
+        await device.read(DataType.COIL, 0, 1)
+
+
+def _write_batch(tmp_path: Path, lines: list[str]) -> tuple[Path, Path, str]:
+    config_path = tmp_path / "device.json"
+    original = json.dumps({"groups": [{"name": "base", "type": "holding", "start": 0, "length": 4}]}, indent=2) + "\n"
+    config_path.write_text(original, encoding="utf-8")
+    script_path = tmp_path / "edits.txt"
+    script_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return config_path, script_path, original
+
+
+def test_batch_failing_line_leaves_config_unchanged(tmp_path: Path) -> None:
+    config_path, script_path, original = _write_batch(
+        tmp_path, ["groups add x --start 10 --length 2", "groups remove nosuch"]
+    )
+    result = CliRunner().invoke(
+        mock_server_cli.app, ["batch", "--config", str(config_path), "--script", str(script_path)]
+    )
+
+    assert result.exit_code != 0
+    assert "Applied" not in result.output
+    assert config_path.read_text(encoding="utf-8") == original
+
+
+def test_batch_soft_failure_leaves_config_unchanged(tmp_path: Path) -> None:
+    config_path, script_path, original = _write_batch(
+        tmp_path, ["groups add x --start 10 --length 2", "values clear 99"]
+    )
+    result = CliRunner().invoke(
+        mock_server_cli.app, ["batch", "--config", str(config_path), "--script", str(script_path)]
+    )
+
+    assert result.exit_code != 0
+    assert "No rule set for address 99" in " ".join(result.output.split())
+    assert config_path.read_text(encoding="utf-8") == original
+
+
+def test_batch_applies_all_lines(tmp_path: Path) -> None:
+    config_path, script_path, _ = _write_batch(
+        tmp_path, ["# setup", "groups add x --start 10 --length 2", "values set 12 42", "faults inject latency_ms 25"]
+    )
+    result = CliRunner().invoke(
+        mock_server_cli.app, ["batch", "--config", str(config_path), "--script", str(script_path)]
+    )
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(config_path.read_text(encoding="utf-8"))
+    assert [g["name"] for g in data["groups"]] == ["base", "x"]
+    assert data["rules"] == {"12": {"mode": "frozen-value", "forced_value": 42}}
+    assert data["faults"] == {"latency_ms": 25.0}
+
+
+def test_batch_rejects_groups_reset(tmp_path: Path) -> None:
+    config_path, script_path, original = _write_batch(tmp_path, ["groups add x --start 10 --length 2", "groups reset"])
+    result = CliRunner().invoke(
+        mock_server_cli.app, ["batch", "--config", str(config_path), "--script", str(script_path)], input="y\n"
+    )
+
+    assert result.exit_code != 0
+    assert "cannot be batched" in result.output
+    assert config_path.read_text(encoding="utf-8") == original
+
+
+def test_dump_json_matches_stdlib() -> None:
+    finite = {"groups": [{"name": "a", "start": 0, "length": 2}], "faults": {"latency_ms": 12.5, "drop_rate_pct": 0.1}}
+    assert json.loads(mock_server_cli._dump_json(finite)) == json.loads(json.dumps(finite, indent=2))
+
+    for data in (
+        {"faults": {"latency_ms": float("nan")}},
+        {"rules": {"10": {"forced_value": [1, float("inf")]}}},
+        {"rules": {10: {"mode": "frozen-value"}}},
+    ):
+        assert mock_server_cli._dump_json(data).rstrip("\n") == json.dumps(data, indent=2)
@@ -29,6 +29,29 @@ async def test_probe_success(monkeypatch):
     assert any('5502' in u for u in alive_uris)
 
 
+@pytest.mark.asyncio
+async def test_probe_uri_dict_combo(monkeypatch):
+    seen = []
+
+    def fake_probe(self, uri, target, params, timeout_s):
+        seen.append((uri, params.get('unit')))
+        return True, 'ok'
+
+    monkeypatch.setattr(Prober, '_blocking_probe', fake_probe)
+
+    p = Prober(concurrency=2, attempts=1)
+    combos = [
+        {'uri': 'tcp://127.0.0.1:5502?unit=3', 'unit': 3},
+        {'uri': 'serial://COM9:9600?unit=2', 'unit': 2},
+    ]
+    target = TargetSpec(datatype=DataType.HOLDING, address=0)
+
+    results = await p.run(combos, target)
+    # Serial combos are probed first, sequentially
+    assert [r.uri for r in results] == ['serial://COM9:9600?unit=2', 'tcp://127.0.0.1:5502?unit=3']
+    assert sorted(seen) == [('serial://COM9:9600?unit=2', 2), ('tcp://127.0.0.1:5502?unit=3', 3)]
+
+
 @pytest.mark.asyncio
 async def test_probe_attempts_and_backoff(monkeypatch):
     # Fake probe that returns False first, True second call (per combo)
@@ -0,0 +1,27 @@
+"""Tests for umdt.utils.timefmt module."""
+
+import datetime
+import random
+
+from umdt.utils.timefmt import format_clock_ms
+
+
+def _reference(ts: float) -> str:
+    return datetime.datetime.fromtimestamp(ts).strftime("%H:%M:%S.%f")[:-3]
+
+
+class TestFormatClockMs:
+    """Tests for format_clock_ms function."""
+
+    def test_matches_datetime(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            ts = rng.uniform(1_600_000_000, 1_900_000_000)
+            assert format_clock_ms(ts) == _reference(ts)
+
+    def test_whole_seconds(self):
+        assert format_clock_ms(1_700_000_000.0) == _reference(1_700_000_000.0)
+
+    def test_fraction_rounding_into_next_second(self):
+        ts = 1_700_000_000.9999996
+        assert format_clock_ms(ts) == _reference(ts)
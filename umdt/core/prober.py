@@ -35,7 +35,7 @@ class TargetSpec:
     expected_value: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProbeResult:
     uri: str
     params: Dict[str, Any]
@@ -78,35 +78,36 @@ class Prober:
         """Run probes over the provided combinations.
 
         combinations may be strings (canonical URIs) or dicts describing
-        transport parameters (e.g. {'host':..., 'port':..., 'unit':...} or
-        {'serial': '/dev/ttyS1','baud':9600,'unit':1}).
+        transport parameters (e.g. {'host':..., 'port':..., 'unit':...},
+        {'serial': '/dev/ttyS1','baud':9600,'unit':1} or
+        {'uri': 'tcp://host:502', 'unit': 1}).
         
         Serial combos are probed sequentially to avoid port conflicts; TCP combos
         are probed concurrently.
         """
         results: List[ProbeResult] = []
         
-        # Separate serial and TCP combinations
-        serial_combos = []
-        tcp_combos = []
+        # Separate serial and TCP combinations, normalizing each combo once
+        serial_combos: List[Tuple[str, Dict[str, Any]]] = []
+        tcp_combos: List[Tuple[str, Dict[str, Any]]] = []
         
         for combo in combinations:
             if cancel_token and cancel_token.is_set():
                 break
-            uri, _ = self._normalize_combo_to_uri(combo)
+            uri, params = self._normalize_combo_to_uri(combo)
             parsed = urlparse(uri)
             scheme = parsed.scheme or 'serial'
-            if scheme == 'serial' or (isinstance(combo, dict) and 'serial' in combo):
-                serial_combos.append(combo)
+            if scheme == 'serial' or 'serial' in params:
+                serial_combos.append((uri, params))
             else:
-                tcp_combos.append(combo)
+                tcp_combos.append((uri, params))
         
         # Probe serial combinations sequentially (concurrency=1)
         if serial_combos:
-            for combo in serial_combos:
+            for uri, params in serial_combos:
                 if cancel_token and cancel_token.is_set():
                     break
-                pr = await self._probe_single(combo, target, cancel_token)
+                pr = await self._probe_single(uri, params, target, cancel_token)
                 results.append(pr)
                 if on_result:
                     try:
@@ -120,12 +121,12 @@ class Prober:
             results_lock = asyncio.Lock()
             tasks: List[asyncio.Task] = []
 
-            async def _probe_wrapper(combo: Union[str, Dict[str, Any]]):
+            async def _probe_wrapper(uri: str, params: Dict[str, Any]):
                 async with sem:
                     if cancel_token and cancel_token.is_set():
                         return
                     
-                    pr = await self._probe_single(combo, target, cancel_token)
+                    pr = await self._probe_single(uri, params, target, cancel_token)
                     async with results_lock:
                         results.append(pr)
                     
@@ -135,10 +136,10 @@ class Prober:
                         except Exception:
                             pass
 
-            for combo in tcp_combos:
+            for uri, params in tcp_combos:
                 if cancel_token and cancel_token.is_set():
                     break
-                task = asyncio.create_task(_probe_wrapper(combo))
+                task = asyncio.create_task(_probe_wrapper(uri, params))
                 tasks.append(task)
             
             if tasks:
@@ -148,12 +149,12 @@ class Prober:
     
     async def _probe_single(
         self,
-        combo: Union[str, Dict[str, Any]],
+        uri: str,
+        params: Dict[str, Any],
         target: TargetSpec,
         cancel_token: Optional[asyncio.Event] = None,
     ) -> ProbeResult:
-        """Probe a single combination and return ProbeResult."""
-        uri, params = self._normalize_combo_to_uri(combo)
+        """Probe a single normalized combination and return ProbeResult."""
         start = time.perf_counter()
         alive = False
         resp_summary: Optional[str] = None
@@ -191,12 +192,15 @@ class Prober:
 
         Supported combo shapes:
           - string: already a URI (returned unchanged)
+          - dict with key 'uri' and optional 'unit' -> the URI as given
           - dict with keys 'host' and 'port' and optional 'unit' -> tcp://host:port?unit=X
           - dict with keys 'serial' and 'baud' and optional 'unit' -> serial://PORT:BAUD?unit=X
         """
         if isinstance(combo, str):
             return combo, {}
         params: Dict[str, Any] = dict(combo)
+        if 'uri' in combo:
+            return combo['uri'], params
         if 'host' in combo and 'port' in combo:
             host = combo.get('host')
             port = combo.get('port')
@@ -13,6 +13,7 @@ from PySide6.QtGui import QColor, QFont, QBrush
 
 from umdt.core.sniffer import Sniffer
 from umdt.core.analyzer import TrafficAnalyzer, StateUpdate
+from umdt.utils.timefmt import format_clock_ms
 
 try:
     from serial.tools import list_ports
@@ -46,8 +47,7 @@ class PacketTableModel(QAbstractTableModel):
                 return str(index.row() + 1)
             elif col == 1: # Time
                 ts = packet['timestamp']
-                dt = datetime.datetime.fromtimestamp(ts)
-                return dt.strftime("%H:%M:%S.%f")[:-3]
+                return format_clock_ms(ts)
             elif col == 2: # Slave
                 raw = packet['raw']
                 return str(raw[0]) if raw else "?"
@@ -135,8 +135,7 @@ class StateMapModel(QAbstractTableModel):
                 except Exception:
                     return str(item.value)
             elif col == 5:
-                dt = datetime.datetime.fromtimestamp(item.timestamp)
-                return dt.strftime("%H:%M:%S.%f")[:-3]
+                return format_clock_ms(item.timestamp)
         
         elif role == Qt.TextAlignmentRole:
             if col in (0, 2, 3, 4):
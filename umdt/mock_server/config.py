@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -11,10 +12,26 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     yaml = None
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+_YamlDumper = getattr(yaml, "CSafeDumper", None) or getattr(yaml, "SafeDumper", None)
+
 from umdt.core.data_types import DataType, parse_data_type
 from .models import RegisterGroup, RegisterRule, ResponseMode, ValueScript
 
 
+def load_yaml(text: str) -> Any:
+    """Safe-load YAML text, using libyaml when available. Requires PyYAML."""
+
+    return yaml.load(text, Loader=_YamlLoader)
+
+
+def dump_yaml(data: Any) -> str:
+    """Safe-dump data to YAML, keeping key order. Requires PyYAML."""
+
+    return yaml.dump(data, Dumper=_YamlDumper, sort_keys=False)
+
+
 @dataclass(slots=True)
 class TransportConfig:
     """Transport selection for the mock server."""
@@ -61,23 +78,37 @@ def _to_group(data: Dict[str, Any]) -> RegisterGroup:
     return group
 
 
-def load_config(path: str | Path) -> MockServerConfig:
-    """Parse a YAML/JSON config file into a structured config object."""
+@lru_cache(maxsize=16)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file; cached until its mtime or size changes.
 
-    file_path = Path(path)
-    if not file_path.exists():
-        raise FileNotFoundError(file_path)
+    The result is shared between calls and must be treated as read-only.
+    """
 
+    file_path = Path(path)
     text = file_path.read_text(encoding="utf-8")
     if file_path.suffix.lower() in {".yaml", ".yml"}:
         if yaml is None:
             raise RuntimeError("PyYAML is required to load YAML configs")
-        raw = yaml.safe_load(text)
+        raw = load_yaml(text)
     else:
         raw = json.loads(text)
 
     if not isinstance(raw, dict):
         raise ValueError("Configuration must be an object/dict")
+    return raw
+
+
+def load_config(path: str | Path) -> MockServerConfig:
+    """Parse a YAML/JSON config file into a structured config object."""
+
+    file_path = Path(path)
+    if not file_path.exists():
+        raise FileNotFoundError(file_path)
+
+    stat = file_path.stat()
+    # Only reads from `raw`; everything kept below is copied out of it
+    raw = _parse_config_file(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
 
     groups = [_to_group(item) for item in raw.get("groups", [])]
 
@@ -6,9 +6,24 @@ with multiple interpretations (Hex, UInt, Int, Float) across endian permutations
 
 import struct
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
 from umdt.utils.ieee754 import from_bytes_to_float16, from_bytes_to_float32
 
+# Two 16-bit registers packed big-endian into one 4-byte buffer
+_U16U16_BE = struct.Struct(">HH")
+# Same pair with each word's bytes swapped (BA DC)
+_U16U16_LE = struct.Struct("<HH")
+
+# Register packing per endian name: (byte order within a word, swap words)
+# so that each packed pair reads as big-endian ABCD for that permutation.
+_PAIR_LAYOUTS = {
+    "big": (">", False),        # AB CD
+    "little": ("<", True),      # DC BA
+    "mid-big": (">", True),     # CD AB
+    "mid-little": ("<", False), # BA DC
+}
+
 
 @dataclass
 class DecodingRow:
@@ -40,6 +55,33 @@ class DecodingResult:
     raw_bytes: bytes  # Original raw bytes for reference
 
 
+# Formatting is cached on the raw bytes (NaN-safe keys). Every float16 bit
+# pattern fits in the cache; float32 keeps the most recent values, which
+# covers slowly-changing monitor data.
+@lru_cache(maxsize=65536)
+def _decode_float16(b: bytes) -> Tuple[Optional[float], str]:
+    """Return (value, display string) for 2 big-endian float16 bytes."""
+    try:
+        f16_result = from_bytes_to_float16(b)
+    except Exception:
+        return None, "—"
+    if isinstance(f16_result, str):
+        return None, f16_result
+    return f16_result, f"{f16_result:.6g}"
+
+
+@lru_cache(maxsize=4096)
+def _decode_float32(b: bytes) -> Tuple[Optional[float], str]:
+    """Return (value, display string) for 4 big-endian float32 bytes."""
+    try:
+        f32_result = from_bytes_to_float32(b)
+    except Exception:
+        return None, "—"
+    if isinstance(f32_result, str):
+        return None, f32_result
+    return f32_result, f"{f32_result:.6g}"
+
+
 def decode_register16(reg_value: int, include_all_formats: bool = False) -> DecodingResult:
     """Decode a single 16-bit register value.
 
@@ -59,24 +101,12 @@ def decode_register16(reg_value: int, include_all_formats: bool = False) -> Deco
     rows = []
     for format_name, b in formats:
         uint_val = int.from_bytes(b, byteorder="big", signed=False)
-        int_val = uint_val if uint_val < 0x8000 else uint_val - 0x10000
-        
-        # Float16 interpretation
-        try:
-            f16_result = from_bytes_to_float16(b)
-            if isinstance(f16_result, str):
-                f16_val = None
-                f16_str = f16_result
-            else:
-                f16_val = f16_result
-                f16_str = f"{f16_result:.6g}"
-        except Exception:
-            f16_val = None
-            f16_str = "—"
+        int_val = uint_val - ((uint_val & 0x8000) << 1)
+        f16_val, f16_str = _decode_float16(b)
         
         rows.append(DecodingRow(
             format_name=format_name,
-            hex16=f"0x{b.hex().upper()}",
+            hex16=f"0x{uint_val:04X}",
             uint16=uint_val,
             int16=int_val,
             float16=f16_val,
@@ -101,7 +131,7 @@ def decode_registers32(reg1: int, reg2: int, include_all_formats: bool = True) -
     reg1 = reg1 & 0xFFFF
     reg2 = reg2 & 0xFFFF
     
-    raw = reg1.to_bytes(2, byteorder="big") + reg2.to_bytes(2, byteorder="big")
+    raw = _U16U16_BE.pack(reg1, reg2)
     
     # Define all permutations
     permutations = _get_32bit_permutations(raw)
@@ -113,46 +143,24 @@ def decode_registers32(reg1: int, reg2: int, include_all_formats: bool = True) -
     for format_name, b in permutations:
         # 32-bit interpretations
         uint32_val = int.from_bytes(b, byteorder="big", signed=False)
-        int32_val = uint32_val if uint32_val < 0x80000000 else uint32_val - 0x100000000
+        int32_val = uint32_val - ((uint32_val & 0x80000000) << 1)
         
-        # Float32 interpretation
-        try:
-            f32_result = from_bytes_to_float32(b)
-            if isinstance(f32_result, str):
-                f32_val = None
-                f32_str = f32_result
-            else:
-                f32_val = f32_result
-                f32_str = f"{f32_result:.6g}"
-        except Exception:
-            f32_val = None
-            f32_str = "—"
+        f32_val, f32_str = _decode_float32(b)
         
         # Also provide 16-bit interpretation of first register for reference
         first_reg_bytes = b[0:2]
         uint16_val = int.from_bytes(first_reg_bytes, byteorder="big", signed=False)
-        int16_val = uint16_val if uint16_val < 0x8000 else uint16_val - 0x10000
-        
-        try:
-            f16_result = from_bytes_to_float16(first_reg_bytes)
-            if isinstance(f16_result, str):
-                f16_val = None
-                f16_str = f16_result
-            else:
-                f16_val = f16_result
-                f16_str = f"{f16_result:.6g}"
-        except Exception:
-            f16_val = None
-            f16_str = "—"
+        int16_val = uint16_val - ((uint16_val & 0x8000) << 1)
+        f16_val, f16_str = _decode_float16(first_reg_bytes)
         
         rows.append(DecodingRow(
             format_name=format_name,
-            hex16=f"0x{first_reg_bytes.hex().upper()}",
+            hex16=f"0x{uint16_val:04X}",
             uint16=uint16_val,
             int16=int16_val,
             float16=f16_val,
             float16_str=f16_str,
-            hex32=f"0x{b.hex().upper()}",
+            hex32=f"0x{uint32_val:08X}",
             uint32=uint32_val,
             int32=int32_val,
             float32=f32_val,
@@ -215,6 +223,35 @@ def decode_to_table_dict(result: DecodingResult) -> List[dict]:
     return table_rows
 
 
+def unpack_register_pairs(
+    registers: Sequence[int],
+    endian: str = "big",
+) -> Tuple[bytes, Tuple[int, ...], Tuple[float, ...]]:
+    """Decode consecutive register pairs as 32-bit values in one pass.
+
+    Instead of reordering bytes pair by pair in Python, the registers are
+    packed once in the word/byte order that yields big-endian ABCD groups
+    and then unpacked as int32 and float32 arrays by `struct`.
+
+    Args:
+        registers: 16-bit register values; a trailing odd register is ignored
+        endian: "big", "little", "mid-big" or "mid-little" (unknown -> big)
+
+    Returns:
+        Tuple of (raw, int32 values, float32 values) where `raw` holds the
+        reordered 4-byte group for each pair back to back
+    """
+    pairs = len(registers) // 2
+    if pairs == 0:
+        return b"", (), ()
+    byte_order, swap_words = _PAIR_LAYOUTS.get(endian, _PAIR_LAYOUTS["big"])
+    words = [r & 0xFFFF for r in registers[: pairs * 2]]
+    if swap_words:
+        words[0::2], words[1::2] = words[1::2], words[0::2]
+    raw = struct.pack(f"{byte_order}{pairs * 2}H", *words)
+    return raw, struct.unpack(f">{pairs}i", raw), struct.unpack(f">{pairs}f", raw)
+
+
 def format_permutations_32(registers: List[int]) -> dict:
     """Return structured info for the four common 32-bit orderings.
 
@@ -230,7 +267,7 @@ def format_permutations_32(registers: List[int]) -> dict:
     if len(registers) < 2:
         return {}
     
-    raw = registers[0].to_bytes(2, byteorder="big") + registers[1].to_bytes(2, byteorder="big")
+    raw = _U16U16_BE.pack(registers[0] & 0xFFFF, registers[1] & 0xFFFF)
     permutations = _get_32bit_permutations(raw)
     
     out = {}
@@ -275,9 +312,10 @@ def _get_32bit_permutations(raw: bytes) -> List[tuple]:
     Returns:
         List of (name, bytes) tuples for each permutation
     """
+    hi, lo = _U16U16_BE.unpack(raw)
     return [
         ("Big", raw),
         ("Little", raw[::-1]),
-        ("Mid-Big", bytes([raw[2], raw[3], raw[0], raw[1]])),
-        ("Mid-Little", bytes([raw[1], raw[0], raw[3], raw[2]])),
+        ("Mid-Big", _U16U16_BE.pack(lo, hi)),
+        ("Mid-Little", _U16U16_LE.pack(hi, lo)),
     ]
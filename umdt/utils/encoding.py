@@ -8,6 +8,9 @@ import math
 import struct
 from typing import List, Tuple
 
+# Half-precision bit pattern as an unsigned 16-bit big-endian word
+_HALF_BE = struct.Struct(">H")
+
 
 class EncodingError(Exception):
     """Raised when encoding a value fails."""
@@ -223,6 +226,18 @@ def encode_value(
     return (regs, signed)
 
 
+def _identity(data: bytes) -> bytes:
+    return data
+
+
+_PERMUTATIONS = {
+    "big": _identity,
+    "little": lambda data: data[::-1],
+    "mid-big": lambda data: data[2:4] + data[0:2],
+    "mid-little": lambda data: data[1::-1] + data[:1:-1],
+}
+
+
 def _apply_endian_permutation(data: bytes, endian: str) -> bytes:
     """Apply endian permutation to 4-byte data.
 
@@ -239,17 +254,8 @@ def _apply_endian_permutation(data: bytes, endian: str) -> bytes:
         - mid-big: CDAB (word swap)
         - mid-little: BADC (byte swap within words)
     """
-    if endian == "big":
-        return data
-    elif endian == "little":
-        return data[::-1]
-    elif endian == "mid-big":
-        return bytes([data[2], data[3], data[0], data[1]])
-    elif endian == "mid-little":
-        return bytes([data[1], data[0], data[3], data[2]])
-    else:
-        # Default to big-endian for unknown
-        return data
+    # Default to big-endian for unknown
+    return _PERMUTATIONS.get(endian, _identity)(data)
 
 
 def _float_to_half(f: float) -> int:
@@ -263,39 +269,11 @@ def _float_to_half(f: float) -> int:
     """
     if math.isnan(f):
         return 0x7E00  # quiet NaN
-    if math.isinf(f):
-        return 0x7C00 if f > 0 else 0xFC00
-    
-    sign = 0
-    if f < 0:
-        sign = 0x8000
-        f = -f
-    
-    if f == 0.0:
-        return sign
-    
-    # Calculate exponent and mantissa
-    exp = int(math.floor(math.log(f, 2)))
-    frac = f / (2 ** exp) - 1.0
-    exp16 = exp + 15
-    
-    if exp16 <= 0:
-        # Subnormal
-        mant16 = int(round(f / (2 ** -24)))
-        return sign | mant16
-    elif exp16 >= 0x1F:
-        # Overflow to infinity
-        return sign | 0x7C00
-    else:
-        # Normal number
-        mant16 = int(round(frac * (1 << 10)))
-        if mant16 == (1 << 10):
-            # Mantissa rounded up to next exponent
-            exp16 += 1
-            mant16 = 0
-            if exp16 >= 0x1F:
-                return sign | 0x7C00
-        return sign | (exp16 << 10) | (mant16 & 0x3FF)
+    try:
+        return _HALF_BE.unpack(struct.pack(">e", float(f)))[0]
+    except OverflowError:
+        # Too large for binary16: saturate to signed infinity
+        return 0xFC00 if f < 0 else 0x7C00
 
 
 def normalize_endian(endian_str: str, allow_all: bool = False) -> str:
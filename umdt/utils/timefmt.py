@@ -0,0 +1,40 @@
+"""Timestamp formatting helpers for GUI tables.
+
+Formats wall-clock times as ``HH:MM:SS.mmm`` without going through
+``datetime.strftime``; the ``HH:MM:SS`` part is cached per second since
+consecutive samples and packets mostly share it.
+"""
+
+import math
+import time
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _clock_prefix(seconds: int) -> str:
+    lt = time.localtime(seconds)
+    return f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+
+
+def format_clock_ms(ts: float) -> str:
+    """Format a POSIX timestamp as local ``HH:MM:SS.mmm``.
+
+    Matches ``datetime.fromtimestamp(ts).strftime("%H:%M:%S.%f")[:-3]``:
+    the fraction is rounded to microseconds, then truncated to milliseconds.
+
+    Args:
+        ts: Seconds since the epoch, e.g. from ``time.time()``
+
+    Returns:
+        Time of day string such as ``"14:03:27.512"``
+    """
+    frac, whole = math.modf(ts)
+    seconds = int(whole)
+    us = round(frac * 1_000_000)
+    if us < 0:
+        seconds -= 1
+        us += 1_000_000
+    if us >= 1_000_000:
+        seconds += 1
+        us -= 1_000_000
+    return f"{_clock_prefix(seconds)}.{us // 1000:03d}"